@@ -1,35 +1,77 @@
-import importlib
+import functools
 import inspect
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
-
-import yaml
-from jinja2 import Template
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, TypeVar, Union
 
 from pytalog.base.catalog.dataset import DataSet
 from pytalog.base.data_sources import DataSource
+from pytalog.base.utils.load_callable import load_callable
+from pytalog.base.utils.load_yaml import _hash_params, load_yaml_with_jinja
 from pytalog.base.validation import ValidationSet, Validator, ValidatorObject
 
 Data = TypeVar("Data")
 
+# The exact sets of keys a dictionary can have to be parsed into an object.
+_VALID_KEYSETS = (frozenset({"callable", "args"}), frozenset({"callable", "args", "validations"}))
+
+# Catalogs built with `use_cache=True`, keyed by (absolute path, modification time, size, hash of the parameters).
+_CATALOG_CACHE: "OrderedDict[Tuple[str, int, int, str], Catalog]" = OrderedDict()
+_CATALOG_CACHE_SIZE = 32
+# Guards every read and write of _CATALOG_CACHE, since catalogs may be loaded from several threads.
+_CATALOG_CACHE_LOCK = threading.Lock()
+
 
 class Catalog(Dict[str, DataSource[Data]]):
-    def __init__(self, *args: Any, validation_set: Optional[ValidationSet] = None, **kwargs: Any):
-        """A collection of data_sources that together form a DataSet when loaded."""
+    def __init__(
+        self,
+        *args: Any,
+        validation_set: Optional[ValidationSet] = None,
+        max_read_workers: int = 0,
+        **kwargs: Any,
+    ):
+        """A collection of data_sources that together form a DataSet when loaded.
+
+        Args:
+            *args (Any): Positional arguments to initialise the underlying dictionary with.
+            validation_set (Optional[ValidationSet]): Data validations to run when reading data.
+                Defaults to no validations.
+            max_read_workers (int): The default number of threads `read_all` uses to read data_sources
+                concurrently. Useful when reading is I/O-bound, e.g. for files or databases.
+                Defaults to 0, which reads all data_sources sequentially.
+            **kwargs (Any): name-DataSource pairs to initialise the underlying dictionary with.
+        """
         super().__init__(*args, **kwargs)
 
         if validation_set is None:
             validation_set = ValidationSet()
         self.validation_set = validation_set
+        self.max_read_workers = max_read_workers
 
-    def read_all(self) -> DataSet:
+    def read_all(self, max_workers: Optional[int] = None) -> DataSet:
         """Read all data_sources and generate a DataSet.
 
-        Names of data_sources are preserved when loading the data.
+        Names of data_sources are preserved when loading the data. If `max_workers` is
+        larger than 0, data_sources are read concurrently using a thread pool.
+
+        Args:
+            max_workers (Optional[int]): The number of threads to use for reading. 0 reads all
+                data_sources sequentially, which is easier to debug. Defaults to `max_read_workers`.
 
         Returns:
             DataSet: The DataSet constructed from the data_sources.
         """
+        if max_workers is None:
+            max_workers = self.max_read_workers
+
+        if max_workers > 0 and len(self) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(self))) as executor:
+                futures = {name: executor.submit(data.read) for name, data in self.items()}
+                return DataSet.from_dict({name: future.result() for name, future in futures.items()})
+
         return DataSet.from_dict({name: data.read() for name, data in self.items()})
 
     def __str__(self, indents: int = 0) -> str:
@@ -42,7 +84,7 @@ class Catalog(Dict[str, DataSource[Data]]):
             str: A string representation of this Catalog.
         """
         tab = "\t" * indents
-        return "\n".join([f"{tab}{name}: {source}" for name, source in self.items()])
+        return "\n".join(f"{tab}{name}: {source}" for name, source in self.items())
 
     def read(self, name: str, skip_validation: bool = False) -> Data:
         """Read a particular dataset from this Catalog.
@@ -66,6 +108,7 @@ class Catalog(Dict[str, DataSource[Data]]):
         path: Union[str, Path],
         parameters: Optional[Dict[str, Any]] = None,
         initialised_parameters: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
     ) -> "Catalog":
         """Read a catalog in from a configuration YAML file.
 
@@ -127,10 +170,21 @@ class Catalog(Dict[str, DataSource[Data]]):
             initialised_parameters (Optional[Dict[str, Any]]): Python objects that need to be available as well while
                 loading the catalog. These variables will be passed to DataSource callables as well, following the
                 conditions layed out above.
+            use_cache (bool): Reuse the Catalog built earlier from the same, unchanged file and parameters.
+                Each call returns a new Catalog, but the DataSource objects in it are shared between calls.
+                Ignored if `initialised_parameters` are provided, or if `parameters` can't be represented
+                exactly as JSON, e.g. tuples. Defaults to False.
+
+        Raises:
+            TypeError: If the YAML file or any of its entries don't follow the format described above.
+            ValueError: If an object description or import path is malformed.
 
         Returns:
             Catalog: A Catalog with data_sources based on the YAML file.
         """
+        if use_cache and not initialised_parameters:
+            return _from_yaml_cached(path, {} if parameters is None else parameters)
+
         data_sources = {}
         validation_set = ValidationSet()
 
@@ -139,149 +193,200 @@ class Catalog(Dict[str, DataSource[Data]]):
         if initialised_parameters is None:
             initialised_parameters = {}
 
-        path = Path(path)
-        with open(path, "r") as f:
-            contents = f.read()
-
-            parsed_contents = Template(contents).render(parameters)
-            configuration = yaml.safe_load(parsed_contents)
-        assert isinstance(configuration, dict), "Cannot process YAML as Catalog: should be a dictionary."
+        configuration = load_yaml_with_jinja(path, params=parameters)
+        if not isinstance(configuration, dict):
+            raise TypeError("Cannot process YAML as Catalog: should be a dictionary.")
 
         for dataset_name, dataset_params in configuration.items():
-            dataset = cls._parse_data_source(dataset_params, initialised_parameters)
-            assert isinstance(
-                dataset, DataSource
-            ), "Please make sure objects in your Catalog only translate to data_sources."
+            dataset = _parse_data_source(dataset_params, initialised_parameters)
+            if not isinstance(dataset, DataSource):
+                raise TypeError("Please make sure objects in your Catalog only translate to data_sources.")
             data_sources[dataset_name] = dataset
 
             if "validations" in dataset_params:
                 validations_raw = dataset_params["validations"]
-                assert isinstance(validations_raw, list)
+                if not isinstance(validations_raw, list):
+                    raise TypeError(f"{dataset_name}: validations should be a list.")
 
-                validation_set[dataset_name] = [cls._parse_validation(validation) for validation in validations_raw]
+                validation_set[dataset_name] = [_parse_validation(validation) for validation in validations_raw]
 
         return Catalog(validation_set=validation_set, **data_sources)
 
-    @classmethod
-    def _parse_data_source(cls, dct: Dict[str, Any], initialised_parameters: Optional[Dict[str, Any]] = None) -> Any:
-        """Creates a data source out of the dictionary."""
-        return cls._parse_object(dct, create_object=True, initialised_parameters=initialised_parameters)
 
-    @classmethod
-    def _parse_validation(cls, dct: Dict[str, Any]) -> Validator:
-        """Creates a Validator out of the dictionary."""
-        callable, args = cls._parse_object(dct, create_object=False)
-        if inspect.isclass(callable):
-            assert issubclass(callable, ValidatorObject)
-            return callable(**args)
-        else:
-            return Validator(callable=callable, **args)
+def _from_yaml_cached(path: Union[str, Path], parameters: Dict[str, Any]) -> Catalog:
+    """Build a Catalog from a YAML file, reusing earlier results for unchanged files and parameters.
+
+    Args:
+        path (Union[str, Path]): The path to the YAML file.
+        parameters (Dict[str, Any]): The parameters used for jinja templating.
+
+    Returns:
+        Catalog: A new Catalog, sharing its data_sources and validators with the cached version.
+    """
+    params_hash = _hash_params(parameters)
+    if params_hash is None:
+        return Catalog.from_yaml(path, parameters)
+
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, params_hash)
+    with _CATALOG_CACHE_LOCK:
+        catalog = _CATALOG_CACHE.get(key)
+        if catalog is not None:
+            _CATALOG_CACHE.move_to_end(key)
+
+    if catalog is None:
+        # Built outside the lock: parsing imports modules, which may load other catalogs.
+        catalog = Catalog.from_yaml(path, parameters)
+        with _CATALOG_CACHE_LOCK:
+            catalog = _CATALOG_CACHE.setdefault(key, catalog)
+            _CATALOG_CACHE.move_to_end(key)
+            if len(_CATALOG_CACHE) > _CATALOG_CACHE_SIZE:
+                _CATALOG_CACHE.popitem(last=False)
+
+    return Catalog(catalog, validation_set=ValidationSet(**catalog.validation_set))
+
+
+def _parse_data_source(dct: Dict[str, Any], initialised_parameters: Optional[Dict[str, Any]] = None) -> Any:
+    """Creates a data source out of the dictionary."""
+    return _parse_object(dct, create_object=True, initialised_parameters=initialised_parameters)
+
+
+def _parse_validation(dct: Dict[str, Any]) -> Validator:
+    """Creates a Validator out of the dictionary."""
+    callable, args = _parse_object(dct, create_object=False)
+    if inspect.isclass(callable):
+        if not issubclass(callable, ValidatorObject):
+            raise TypeError(f"{callable.__name__}: validation classes should be a subclass of ValidatorObject.")
+        return callable(**args)
+    else:
+        return Validator(callable=callable, **args)
+
+
+def _parse_object(
+    dct: Dict[str, Any],
+    create_object: bool,
+    initialised_parameters: Optional[Dict[str, Any]] = None,
+) -> Union[Any, Tuple[Callable, Dict[str, Any]]]:
+    """Parse a complex dictionary to create objects.
+
+    This has 2 options:
+        - create_object=True: Creates objects out of the parsed data.
+        - create_object=False: Only returns the function and arguments required to create the object.
+    Nested objects in the arguments are always created.
+
+    The dictionary is walked iteratively instead of recursively, so deeply nested objects don't
+    add Python call overhead. Nested objects are created in the same order as they appear in the
+    arguments, before the object that uses them.
+
+    Args:
+        dct (Dict[str, Any]): A dictionary containing 2 fields:
+            - callable: A python path to a class or static/class method on a class.
+                Used to initiate the object.
+            - args: a dictionary of args to instantiate the object with or call the
+                method with. Can be another complex object.
+        create_object (bool): Whether to create the object or just return the function and arguments.
+        initialised_parameters (Optional[Dict[str, Any]]): Python objects that may to be available as well while
+            loading an object.
+
+    Returns:
+        Union[Any, Tuple[Callable, Dict[str, Any]]]: This returns either:
+            If create_object=True:
+                Any: The object created by combining the function and arguments.
+            Else:
+                Tuple[Callable, Dict[str, Any]]:
+                    - The callable function.
+                    - The arguments to said function.
+    """
+    if not _is_valid_parseable_object(dct):
+        raise ValueError("Catalog: any dictionary parsed should have a `callable` and `args` entry.")
+
+    # Walk the objects top-down, storing each object as (callable, parsed args, parent args, name in parent).
+    # Placeholders keep the argument order of the parent intact until its nested objects are created.
+    # Paths to nested objects are only used in error messages: they are stored as (parent path, name)
+    # pairs and only formatted when needed, see `_format_path`.
+    objects: List[Tuple[Callable, Dict[str, Any], Optional[Dict[str, Any]], str]] = []
+    todo: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]], str, Any]] = [(dct, None, "", None)]
+    while todo:
+        obj, parent_args, name, path = todo.pop()
+        callable_ = load_callable(obj["callable"])
+        args = obj["args"]
+        if not isinstance(args, dict):
+            prefix = f"{_format_path(path)}: " if path else ""
+            raise TypeError(f"{prefix}Arguments to a parseable object should be a dict.")
+
+        parsed_args: Dict[str, Any] = {}
+        for arg_name, arg_value in args.items():
+            # Inlined version of `_is_valid_parseable_object`, cheapest checks first: this runs for every argument.
+            if (
+                type(arg_value) is dict
+                and "callable" in arg_value
+                and "args" in arg_value
+                and (len(arg_value) == 2 or (len(arg_value) == 3 and "validations" in arg_value))
+            ):
+                parsed_args[arg_name] = None
+                todo.append((arg_value, parsed_args, arg_name, (path, arg_name)))
+            else:
+                parsed_args[arg_name] = arg_value
 
-    @classmethod
-    def _parse_object(
-        cls,
-        dct: Dict[str, Any],
-        create_object: bool,
-        initialised_parameters: Optional[Dict[str, Any]] = None,
-    ) -> Union[Any, Tuple[Callable, Dict[str, Any]]]:
-        """Recursively parse a complex dictionary to create objects.
+        objects.append((callable_, parsed_args, parent_args, name))
 
-        This has 2 options:
-            - create_object=True: Creates objects out of the parsed data.
-            - create_object=False: Only returns the function and arguments required to create the object.
-        This only returns the function and the arguments. You can combine the 2 to create
+    # Nested objects always appear after their parents, so create them bottom-up.
+    for callable_, parsed_args, parent_args, name in reversed(objects):
+        # Only add a initialised parameter if:
+        # 1. it matches an argument name in this callable
+        # 2. AND it doesn't have a value yet.
+        if initialised_parameters:
+            for arg_name in _argnames(callable_) & (initialised_parameters.keys() - parsed_args.keys()):
+                parsed_args[arg_name] = initialised_parameters[arg_name]
 
-        Args:
-            dct (Dict[str, Any]): A dictionary containing 2 fields:
-                - callable: A python path to a class or static/class method on a class.
-                    Used to initiate the object.
-                - args: a dictionary of args to instantiate the object with or call the
-                    method with. Can be another complex object.
-            create_object (bool): Whether to create the object or just return the function and arguments.
-            initialised_parameters (Optional[Dict[str, Any]]): Python objects that may to be available as well while
-                loading an object.
+        if parent_args is not None:
+            parent_args[name] = callable_(**parsed_args)
 
-        Returns:
-            Union[Any, Tuple[Callable, Dict[str, Any]]]: This returns either:
-                If create_object=True:
-                    Tuple[Callable, Dict[str, Any]]:
-                        - The callable function.
-                        - The arguments to said function.
-                Else:
-                    Any: The object created by combining the function and arguments.
-        """
-        assert cls._is_valid_parseable_object(
-            dct
-        ), "Catalog: any dictionary parsed should have a `callable` and `args` entry."
+    callable_, parsed_args, _, _ = objects[0]
+    if create_object:
+        return callable_(**parsed_args)
+    else:
+        return callable_, parsed_args
 
-        callable_ = cls._load_class(dct["callable"])
-        args = dct["args"]
-        assert isinstance(args, dict), "Arguments to a parseable object should be a dict."
 
-        if initialised_parameters is None:
-            initialised_parameters = {}
+def _format_path(path: Any) -> str:
+    """Format the path to a nested object as used in `_parse_object`, e.g. `args.df.args.data`.
 
-        # Parse arguments recursively
-        parsed_args = {}
-        for arg_name, arg_value in args.items():
-            if cls._is_valid_parseable_object(arg_value):
-                parsed_value = cls._parse_object(arg_value, create_object=True)
-            else:
-                parsed_value = arg_value
+    Args:
+        path (Any): Nested (parent path, argument name) pairs, None for the top-level object.
 
-            parsed_args[arg_name] = parsed_value
+    Returns:
+        str: The path in dotted notation.
+    """
+    names = []
+    while path is not None:
+        path, name = path
+        names.append(f"args.{name}")
+    return ".".join(reversed(names))
 
-        # Only add a initialised parameter if:
-        # 1. it matches an argument name in this callable
-        # 2. AND it doesn't have a value yet.
-        argspec = inspect.getfullargspec(callable_)
-        for arg_name in argspec[0]:
-            if arg_name in initialised_parameters and arg_name not in parsed_args:
-                parsed_args[arg_name] = initialised_parameters[arg_name]
 
-        if create_object:
-            return callable_(**parsed_args)
-        else:
-            return callable_, parsed_args
+def _is_valid_parseable_object(dct: Dict[str, Any]) -> bool:
+    """Check if a dictionary describes an object to create: it should contain `callable` and `args`."""
+    if not isinstance(dct, dict):
+        return False
+    keys = dct.keys()
+    return keys == _VALID_KEYSETS[0] or keys == _VALID_KEYSETS[1]
 
-    @staticmethod
-    def _load_class(full_path: str) -> Callable:
-        """Load a callable from a Python import path.
 
-        Supported functionality includes:
-        - Importing a class, e.g. pandas.DataFrame.
-        - Importing a static / class method, e.g. pytalog.base.catalog.Catalog:from_yaml
+@functools.lru_cache(maxsize=1024)
+def _argnames(fn: Callable) -> FrozenSet[str]:
+    """Get the names of the arguments of a callable that can be passed by keyword.
 
-        Args:
-            full_path (str): The path leading to the class or function to import.
+    Variable positional / keyword arguments (`*args`, `**kwargs`) are not included.
 
-        Returns:
-            Callable: The class or function described in the `full_path` variable.
-        """
-        # check if we need to import a method.
-        method_split = full_path.split(":")
-        assert len(method_split) <= 2, f"{full_path}: Catalogs do not accept paths with more than 1 `:`"
-        callable_path = method_split[0]
-
-        # for importing we need to split out the last part of the string.
-        split_path = callable_path.split(".")
-        module_path = ".".join(split_path[:-1])
-        class_path = split_path[-1]
-
-        # Import the module and get the class.
-        module = importlib.import_module(module_path)
-        callable = getattr(module, class_path)
-
-        # Return the method if that was requested, otherwise just return the class.
-        if len(method_split) > 1:
-            return getattr(callable, method_split[1])
-        else:
-            return callable
-
-    @staticmethod
-    def _is_valid_parseable_object(dct: Dict[str, Any]) -> bool:
-        if not isinstance(dct, dict):
-            return False
-        opts = [["callable", "args"], ["callable", "args", "validations"]]
-
-        return any([len(dct) == len(opt) and all([p in dct for p in opt]) for opt in opts])
+    Args:
+        fn (Callable): The callable to inspect.
+
+    Returns:
+        FrozenSet[str]: The argument names. Empty if the callable can't be inspected.
+    """
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return frozenset()
+    return frozenset(p.name for p in parameters if p.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD)
@@ -79,12 +79,12 @@ class Configuration(Generic[ConfigClass]):
         # Load all parameter files in order.
         parameters: Dict[str, Any] = {}
         for param_path in parameters_paths:
-            new_params = load_yaml_with_jinja(param_path, params=parameters.copy())
+            new_params = load_yaml_with_jinja(param_path, params=parameters)
             parameters = cls._nested_update(parameters, new_params)
 
         for param_path in optional_parameters_paths:
             if param_path.exists():
-                new_params = load_yaml_with_jinja(param_path, params=parameters.copy())
+                new_params = load_yaml_with_jinja(param_path, params=parameters)
                 parameters = cls._nested_update(parameters, new_params)
 
             else:
@@ -106,9 +106,29 @@ class Configuration(Generic[ConfigClass]):
 
     @classmethod
     def _nested_update(cls, d: Dict[str, Any], u: Dict[str, Any]) -> Dict[str, Any]:
-        for k, v in u.items():
-            if isinstance(v, dict):
-                d[k] = cls._nested_update(d.get(k, {}), v)
-            else:
-                d[k] = v
+        """Recursively update `d` with the values in `u`.
+
+        Nested dictionaries are merged instead of replaced. This walks the dictionaries
+        using a stack instead of recursion, avoiding a function call per nested level.
+        Only keys present in both dictionaries are walked: nested dictionaries from `u`
+        that don't overlap with `d` are moved into `d` as-is, without copying.
+
+        Args:
+            d (Dict[str, Any]): The dictionary to update. Modified in place.
+            u (Dict[str, Any]): The dictionary with new values. Its nested dictionaries may
+                become part of `d`, so don't use it after calling this function.
+
+        Returns:
+            Dict[str, Any]: `d`, updated with the values from `u`.
+        """
+        stack = [(d, u)]
+        while stack:
+            target, update = stack.pop()
+            for k, v in update.items():
+                if isinstance(v, dict):
+                    child = target.get(k)
+                    if isinstance(child, dict):
+                        stack.append((child, v))
+                        continue
+                target[k] = v
         return d
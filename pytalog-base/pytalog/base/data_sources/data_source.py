@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Iterator, TypeVar
 
 Data = TypeVar("Data")
 
@@ -19,6 +19,21 @@ class DataSource(ABC, Generic[Data]):
         """
         raise NotImplementedError
 
+    def iter_read(self, batch_size: int = 65536) -> Iterator[Data]:
+        """Read data from a given source in batches.
+
+        Useful to process datasets that don't fit in memory at once. By default this
+        yields the result of `read` as a single batch: subclasses can override this
+        to actually read in chunks.
+
+        Args:
+            batch_size (int): The maximum number of records per batch, if supported by the source.
+
+        Yields:
+            Data: Batches of data.
+        """
+        yield self.read()
+
 
 class DataSink(ABC, Generic[Data]):
     """An abstract base class for a way to write data."""
@@ -1,2 +1,3 @@
+from .load_callable import load_callable
 from .load_yaml import load_yaml_with_jinja
 from .logger import build_logger
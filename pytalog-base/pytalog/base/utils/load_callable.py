@@ -0,0 +1,41 @@
+import functools
+import importlib
+import sys
+from typing import Callable
+
+
+@functools.lru_cache(maxsize=None)
+def load_callable(full_path: str) -> Callable:
+    """Load a callable from a Python import path.
+
+    Supported functionality includes:
+    - Importing a class, e.g. pandas.DataFrame.
+    - Importing a static / class method, e.g. pytalog.base.catalog.Catalog:from_yaml
+
+    Results are cached: import paths and the objects they point to don't change during a session.
+
+    Args:
+        full_path (str): The path leading to the class or function to import.
+
+    Returns:
+        Callable: The class or function described in the `full_path` variable.
+    """
+    # check if we need to import a method.
+    callable_path, _, method = full_path.partition(":")
+    if ":" in method:
+        raise ValueError(f"{full_path}: Import paths can not contain more than 1 `:`")
+
+    # for importing we need to split out the last part of the string.
+    module_path, _, class_path = callable_path.rpartition(".")
+
+    # Import the module and get the class. Fully imported modules can be taken from sys.modules directly.
+    module = sys.modules.get(module_path)
+    if module is None or getattr(getattr(module, "__spec__", None), "_initializing", False):
+        module = importlib.import_module(module_path)
+    callable = getattr(module, class_path)
+
+    # Return the method if that was requested, otherwise just return the class.
+    if method:
+        return getattr(callable, method)
+    else:
+        return callable
@@ -1,19 +1,269 @@
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
 
 import yaml
-from jinja2 import Template
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, FileSystemBytecodeCache, Template
+
+
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    """Serialise an object to utf-8 encoded JSON using the standard library.
+
+    Args:
+        obj (Any): The object to serialise.
+
+    Returns:
+        bytes: The encoded JSON.
+    """
+    return json.dumps(obj).encode("utf-8")
+
+
+# orjson parses and writes the JSON cache files several times faster than the standard library.
+_json_loads: Callable[[bytes], Any]
+_json_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    _json_loads, _json_dumps = orjson.loads, orjson.dumps
+except ImportError:  # pragma: no cover
+    _json_loads, _json_dumps = json.loads, _stdlib_json_dumps
+
+
+# Use the libyaml-backed loader when PyYAML was built with it, it parses a lot faster.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML files, keyed by (path, modification time, size, hash of the jinja parameters).
+# The size catches changes within the resolution of the modification time.
+_YAML_CACHE: "OrderedDict[Tuple[str, int, int, str], Any]" = OrderedDict()
+_YAML_CACHE_SIZE = 128
+# Guards every read and write of the in-memory caches, since YAML files may be loaded from several threads.
+_CACHE_LOCK = threading.Lock()
+
+# Compiling templates is expensive, so we compile each unique template only once using a shared Environment.
+# jinja2 is slow to import and many YAML files don't use it, so it is imported and created on first use.
+_JINJA_ENV: Optional["Environment"] = None
+_TEMPLATE_CACHE: "OrderedDict[bytes, Template]" = OrderedDict()
+_TEMPLATE_CACHE_SIZE = 256
+# Files without any of these don't need to be templated at all.
+_JINJA_MARKERS = (b"{{", b"{%", b"{#")
+
+# Scalar types produced by the YAML loader that never need to be copied.
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Set this environment variable to "1" to store parsed YAML files in a JSON file next to the original.
+# JSON parses a lot faster than YAML, which speeds up loading unchanged files in new processes.
+# Compiled templates are then also stored in a per-user temporary directory.
+DISK_CACHE_ENV_VAR = "PYTALOG_YAML_CACHE"
+# Created on first use, since it creates its cache directory.
+_BYTECODE_CACHE: Optional["FileSystemBytecodeCache"] = None
 
 
 def load_yaml_with_jinja(file_path: Union[str, Path], params: Dict[str, Any] = {}) -> Any:
-    """Load a YAML file and apply jinja templating to it."""
-    with open(file_path, "r") as file:
-        file_content = file.read()
+    """Load a YAML file and apply jinja templating to it.
+
+    Results are cached in memory, keyed by the file, its modification time and size, and
+    the parameters used for templating. Changing the file on disk invalidates the cache.
+    Results are not cached if the parameters can't be represented exactly as JSON, e.g. tuples.
+
+    If the `PYTALOG_YAML_CACHE` environment variable is set to "1", results are also
+    cached on disk in a `<file>.cache.json` file next to the YAML file.
+
+    Args:
+        file_path (Union[str, Path]): The path to the YAML file.
+        params (Dict[str, Any]): The parameters to use for jinja templating. Not modified.
+
+    Returns:
+        Any: The parsed YAML file. This is always a fresh copy, so it is safe to modify.
+    """
+    params_hash = _hash_params(params)
+    if params_hash is None:
+        return _load(file_path, params)
+
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, params_hash)
+    with _CACHE_LOCK:
+        cached = key in _YAML_CACHE
+        if cached:
+            _YAML_CACHE.move_to_end(key)
+            result = _YAML_CACHE[key]
+    if cached:
+        # Cached results are never modified, so they can be copied outside the lock.
+        return _copy_tree(result, {})
+
+    if os.environ.get(DISK_CACHE_ENV_VAR) == "1":
+        result = _load_with_disk_cache(Path(file_path), params, params_hash)
+    else:
+        result = _load(file_path, params)
+
+    with _CACHE_LOCK:
+        _YAML_CACHE[key] = result
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+    return _copy_tree(result, {})
+
+
+def _load(file_path: Union[str, Path], params: Dict[str, Any]) -> Any:
+    """Read, template and parse a YAML file without any caching.
+
+    Args:
+        file_path (Union[str, Path]): The path to the YAML file.
+        params (Dict[str, Any]): The parameters to use for jinja templating.
+
+    Returns:
+        Any: The parsed YAML file.
+    """
+    file_content = Path(file_path).read_bytes()
+    if not _has_jinja_markers(file_content):
+        # Nothing to template: libyaml can parse the raw bytes directly.
+        return yaml.load(file_content, Loader=_Loader)
+
     rendered_file_content = _apply_jinja(file_content, params)
-    return yaml.safe_load(rendered_file_content)
+    return yaml.load(rendered_file_content, Loader=_Loader)
+
+
+def _load_with_disk_cache(path: Path, params: Dict[str, Any], params_hash: str) -> Any:
+    """Load a YAML file through a JSON cache file stored next to it.
+
+    The cache file stores the modification time and size of the YAML file it was created
+    from. It is used if these still match the YAML file and it was created with the same
+    parameters. Otherwise the YAML file is parsed and the cache file is (re)written.
+    Results that can't be stored losslessly as JSON are not cached.
+    orjson is used to read and write the cache file if it is installed.
+
+    Args:
+        path (Path): The path to the YAML file.
+        params (Dict[str, Any]): The parameters to use for jinja templating.
+        params_hash (str): The hash of `params`, see `_hash_params`.
+
+    Returns:
+        Any: The parsed YAML file.
+    """
+    cache_path = path.with_suffix(path.suffix + ".cache.json")
+    stat = os.stat(path)
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+        if (
+            cached["mtime_ns"] == stat.st_mtime_ns
+            and cached["size"] == stat.st_size
+            and cached["params"] == params_hash
+        ):
+            return cached["content"]
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing or corrupt cache files are simply regenerated.
+        pass
+
+    result = _load(path, params)
+    try:
+        serialised = _json_dumps(
+            {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "params": params_hash, "content": result}
+        )
+    except (TypeError, ValueError):
+        return result
+    if _json_loads(serialised)["content"] != result:
+        # E.g. dates or non-string keys, which JSON can't represent.
+        return result
+
+    # Write to a temporary file first, so other processes never read a half-written cache file.
+    # Caching is best effort: e.g. the directory may be read-only.
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return result
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(serialised)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return result
 
 
-def _apply_jinja(string: str, configuration: Dict[str, Any]) -> str:
+def _copy_tree(value: Any, memo: Dict[int, Any]) -> Any:
+    """Deep copy a parsed YAML file.
+
+    Faster than `copy.deepcopy` for the dictionaries, lists and scalars that make up most YAML
+    files, since immutable scalars are returned as-is. Anything else is copied using `copy.deepcopy`.
+    Like `copy.deepcopy`, shared and recursive structures (YAML anchors and aliases) are preserved.
+
+    Args:
+        value (Any): The object to copy.
+        memo (Dict[int, Any]): Copies made so far, keyed by the id of the original.
+
+    Returns:
+        Any: A deep copy of `value`.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+
+    result = memo.get(id(value))
+    if result is not None:
+        return result
+
+    if value_type is dict:
+        result = memo[id(value)] = {}
+        for k, v in value.items():
+            result[k] = v if type(v) in _IMMUTABLE_TYPES else _copy_tree(v, memo)
+        return result
+    if value_type is list:
+        result = memo[id(value)] = []
+        result.extend(v if type(v) in _IMMUTABLE_TYPES else _copy_tree(v, memo) for v in value)
+        return result
+    return copy.deepcopy(value, memo)
+
+
+def clear_cache() -> None:
+    """Clear the in-memory caches of parsed YAML files and compiled templates."""
+    with _CACHE_LOCK:
+        _YAML_CACHE.clear()
+        _TEMPLATE_CACHE.clear()
+
+
+def _hash_params(params: Dict[str, Any]) -> Optional[str]:
+    """Create a stable hash of the parameters used for templating.
+
+    Only parameters that survive a JSON round trip unchanged are hashed. Otherwise different
+    parameters could share a hash, e.g. a tuple and a list, or the keys `1` and `"1"`.
+
+    Args:
+        params (Dict[str, Any]): The parameters to hash.
+
+    Returns:
+        Optional[str]: A hex digest of the parameters, or None if they can't be hashed reliably
+            and results using them should not be cached.
+    """
+    try:
+        serialised = json.dumps(params, sort_keys=True)
+    except (TypeError, ValueError):
+        # E.g. objects JSON can't represent, or keys of mixed types, which cannot be sorted.
+        return None
+    if json.loads(serialised) != params:
+        return None
+    return hashlib.blake2b(serialised.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _has_jinja_markers(source: bytes) -> bool:
+    """Check if a utf-8 encoded template contains any jinja syntax.
+
+    Args:
+        source (bytes): The encoded template.
+
+    Returns:
+        bool: True if `source` contains any expression, statement or comment markers.
+    """
+    return any(marker in source for marker in _JINJA_MARKERS)
+
+
+def _apply_jinja(string: Union[str, bytes], configuration: Dict[str, Any]) -> str:
     """A basic wrapper to apply Jinga templating to a string.
 
     Please make sure any template strings are prefaced with `configs.`, e.g.
@@ -22,7 +272,8 @@ def _apply_jinja(string: str, configuration: Dict[str, Any]) -> str:
     "Will apply {{ configs.content }} by inserting `content`."
 
     Args:
-        string (str): The string with Jinja formatting
+        string (Union[str, bytes]): The string with Jinja formatting. Bytes should be utf-8 encoded,
+            and are only decoded if the template isn't compiled yet.
         configuration (Dict[str, Any]): The configuration dict
             to use to replace values in the string.
 
@@ -30,4 +281,68 @@ def _apply_jinja(string: str, configuration: Dict[str, Any]) -> str:
         str: `string`, but with Jinja templating applied using the
             configuration dictionary.
     """
-    return Template(string).render(configuration)
+    source = string.encode("utf-8") if isinstance(string, str) else string
+    if not _has_jinja_markers(source):
+        # Rendering a template without any jinja syntax returns it unchanged.
+        return string if isinstance(string, str) else source.decode("utf-8")
+
+    key = hashlib.blake2b(source, digest_size=16).digest()
+    with _CACHE_LOCK:
+        template = _TEMPLATE_CACHE.get(key)
+        if template is not None:
+            _TEMPLATE_CACHE.move_to_end(key)
+
+    if template is None:
+        template = _compile_template(source.decode("utf-8"), key)
+        with _CACHE_LOCK:
+            template = _TEMPLATE_CACHE.setdefault(key, template)
+            _TEMPLATE_CACHE.move_to_end(key)
+            if len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_SIZE:
+                _TEMPLATE_CACHE.popitem(last=False)
+    return template.render(configuration)
+
+
+def _get_jinja_env() -> "Environment":
+    """Get the shared jinja Environment, creating it on first use.
+
+    Returns:
+        Environment: The shared jinja Environment.
+    """
+    global _JINJA_ENV
+    if _JINJA_ENV is None:
+        from jinja2 import Environment
+
+        _JINJA_ENV = Environment()
+    return _JINJA_ENV
+
+
+def _compile_template(source: str, digest: bytes) -> "Template":
+    """Compile a jinja template, using the on-disk bytecode cache if it is enabled.
+
+    Args:
+        source (str): The template.
+        digest (bytes): A digest of `source`, used to name the cache entry.
+
+    Returns:
+        Template: The compiled template.
+    """
+    env = _get_jinja_env()
+    if os.environ.get(DISK_CACHE_ENV_VAR) != "1":
+        return env.from_string(source)
+
+    global _BYTECODE_CACHE
+    if _BYTECODE_CACHE is None:
+        from jinja2 import FileSystemBytecodeCache
+
+        _BYTECODE_CACHE = FileSystemBytecodeCache()
+
+    name = digest.hex()
+    bucket = _BYTECODE_CACHE.get_bucket(env, name, None, source)
+    if bucket.code is None:
+        bucket.code = env.compile(source, name)
+        try:
+            _BYTECODE_CACHE.set_bucket(bucket)
+        except OSError:
+            # Caching is best effort.
+            pass
+    return env.template_class.from_code(env, bucket.code, env.make_globals(None))
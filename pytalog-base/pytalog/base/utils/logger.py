@@ -1,6 +1,14 @@
 import logging
 from typing import Optional
 
+# Shared between all loggers created through build_logger.
+_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(pathname)s:%(lineno)d - %(levelname)s - %(message)s")
+_HANDLER = logging.StreamHandler()
+_HANDLER.setFormatter(_FORMATTER)
+
+# py4j (used by Spark) is very verbose, but only needs to be silenced once per process.
+_CONFIGURED = False
+
 
 def build_logger(name: Optional[str]) -> logging.Logger:
     """
@@ -12,13 +20,13 @@ def build_logger(name: Optional[str]) -> logging.Logger:
     Returns:
         logging.Logger: Logger object.
     """
+    global _CONFIGURED
+    if not _CONFIGURED:
+        logging.getLogger("py4j").setLevel(logging.WARNING)
+        _CONFIGURED = True
+
     logger = logging.getLogger(name)
     if not logger.handlers:
-        logging.getLogger("py4j").setLevel(logging.WARNING)
-        logger.setLevel(logging.INFO)
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(pathname)s:%(lineno)d - %(levelname)s - %(message)s")
-        handler = logging.StreamHandler()
         logger.setLevel(logging.INFO)
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        logger.addHandler(_HANDLER)
     return logger
@@ -5,8 +5,13 @@ from pytalog.base.validation.validator import Validator
 
 Data = TypeVar("Data")
 
+_LOG = logging.getLogger(__name__)
+
 
 class ValidationSet(Dict[str, List[Validator]]):
+    # Shared by all instances: getLogger takes a module-wide lock.
+    logger = _LOG
+
     def __init__(self, **kwargs: Any) -> None:
         """Provides a set of data validations.
 
@@ -15,7 +20,6 @@ class ValidationSet(Dict[str, List[Validator]]):
                 of data validations.
         """
         super().__init__(**kwargs)
-        self.logger = logging.getLogger(__name__)
 
     def validate_data(self, name: str, data: Data) -> Data:
         """
@@ -31,15 +35,21 @@ class ValidationSet(Dict[str, List[Validator]]):
         Returns:
             Data: Data source object.
         """
-        if name in self.keys():
-            self.logger.info(f">>> Validating data: {name}")
-            for validation in self[name]:
+        if name not in self:
+            return data
+
+        # Skip getting names and formatting messages if they won't be logged anyway.
+        info_enabled = _LOG.isEnabledFor(logging.INFO)
+        if info_enabled:
+            _LOG.info(">>> Validating data: %s", name)
+        for validation in self[name]:
+            if info_enabled:
                 function_name = validation.get_name()
+                _LOG.info(">>> - For expectation: %s", function_name)
+            validation.validate(data)
+            if info_enabled:
+                _LOG.info(">>> - Expectation %s passed!", function_name)
 
-                self.logger.info(f">>> - For expectation: {function_name}")
-                validation.validate(data)
-                self.logger.info(f">>> - Expectation {function_name} passed!")
-
-            self.logger.info(f"Table {name} validated successfully!")
-
+        if info_enabled:
+            _LOG.info("Table %s validated successfully!", name)
         return data
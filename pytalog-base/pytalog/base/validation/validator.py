@@ -17,6 +17,7 @@ class Validator(Generic[Data]):
         """
         self.kwargs = kwargs
         self.callable = callable
+        self._name = getattr(callable, "__name__", type(callable).__name__)
 
     def validate(self, data: Data) -> None:
         """Validates if the given data meets this validation setup.
@@ -26,6 +27,7 @@ class Validator(Generic[Data]):
         Args:
             data (Data): The data to be checked.
         """
+        # Read kwargs on every call, so later changes to them are respected.
         self.callable(data, **self.kwargs)
 
     def get_name(self) -> str:
@@ -33,7 +35,7 @@ class Validator(Generic[Data]):
 
         By default, this is the name of the function.
         """
-        return self.callable.__name__
+        return self._name
 
 
 class ValidatorObject(Generic[Data], Validator[Data], ABC):
@@ -1,23 +1,25 @@
 from setuptools import find_namespace_packages, setup
 
 if __name__ == "__main__":
-    version = "0.0.1"
+    version = "0.0.2"
 
     dev_deps = ["pre-commit", "build==0.8.0", "pypiserver==1.5.1", "twine==4.0.1", "pdoc==13.1.0"]
-    test_deps = ["pytest", "pytest-cov"]
+    test_deps = ["pytest", "pytest-cov", "pytest-xdist"]
     deps = [
         "PyYAML==6.0.1",
         "jinja2==3.1.2",
     ]
     strict_deps = [s.replace(">=", "==") for s in deps]
+    json_deps = ["orjson>=3.8"]
 
     setup(
         name="pytalog-base",
         install_requires=deps,
         extras_require={
-            "dev": strict_deps + dev_deps + test_deps,
+            "dev": strict_deps + json_deps + dev_deps + test_deps,
             "test": strict_deps + test_deps,
             "strict": strict_deps,
+            "json": json_deps,
         },
         packages=find_namespace_packages(include=["pytalog.*"]),
         version=version,
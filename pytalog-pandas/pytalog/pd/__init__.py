@@ -1 +1 @@
-from . import data_sources
+from . import data_sources, validation
@@ -1,24 +1,44 @@
+from typing import Literal
+
 import pandas as pd
 
 from pytalog.base.data_sources.data_source import DataSource
 
+CopyMode = Literal["none", "shallow", "deep"]
+
 
 class DataFrameSource(DataSource[pd.DataFrame]):
-    def __init__(self, df: pd.DataFrame) -> None:
+    COPY_MODES = ("none", "shallow", "deep")
+
+    def __init__(self, df: pd.DataFrame, copy: CopyMode = "none") -> None:
         """A DataSource based around a created DataFrame.
 
         Good for testing purposes, but please use other sources for actual usage.
 
         Args:
             df (pd.DataFrame): The DataFrame to use as a source.
+            copy (CopyMode): How `read` protects `df` against changes by the caller:
+                - "none": return `df` itself. Cheapest, and safe with pandas' copy-on-write mode enabled.
+                - "shallow": return a new DataFrame sharing the underlying data with `df`.
+                - "deep": return a full copy of `df`. Safest, but doubles memory usage.
+                Defaults to "none".
+
+        Raises:
+            ValueError: If `copy` is not one of the supported modes.
         """
         super().__init__()
+        if copy not in self.COPY_MODES:
+            raise ValueError(f"`{copy}` is not a supported copy mode, choose from {self.COPY_MODES}.")
+
         self.df = df
+        self.copy = copy
 
     def read(self) -> pd.DataFrame:
         """Returns the DataFrame given as input before.
 
         Returns:
-            pd.DataFrame: The DataFrame used to initialise this object.
+            pd.DataFrame: The DataFrame used to initialise this object, copied according to `copy`.
         """
-        return self.df
+        if self.copy == "none":
+            return self.df
+        return self.df.copy(deep=self.copy == "deep")
@@ -1,9 +1,14 @@
-from typing import Any, Dict, Optional
+import functools
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
 
 from pytalog.base.data_sources.data_source import WriteableDataSource
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class PandasFileSource(WriteableDataSource[pd.DataFrame]):
     PANDAS_IO_FUNCTIONS = {
@@ -12,6 +17,19 @@ class PandasFileSource(WriteableDataSource[pd.DataFrame]):
         "parquet": (pd.read_parquet, lambda df, path, **args: df.to_parquet(path, **args)),
         "excel": (pd.read_excel, lambda df, path, **args: df.to_excel(path, **args)),
     }
+    # The argument of the read function used to select columns, per format.
+    COLUMN_ARGS = {
+        "csv": "usecols",
+        "parquet": "columns",
+        "excel": "usecols",
+    }
+    # Parquet is read and written with pyarrow unless another engine is requested,
+    # so the result doesn't depend on which engines happen to be installed.
+    # Local files are memory-mapped, which avoids copying them into an intermediate buffer.
+    PARQUET_READ_DEFAULTS = {"engine": "pyarrow", "use_threads": True, "memory_map": True}
+    PARQUET_WRITE_DEFAULTS = {"engine": "pyarrow", "compression": "snappy"}
+    # Formats that can be read using polars, see `use_polars`.
+    POLARS_FORMATS = ("csv", "parquet")
 
     def __init__(
         self,
@@ -19,6 +37,9 @@ class PandasFileSource(WriteableDataSource[pd.DataFrame]):
         format: str,
         read_args: Optional[Dict[str, Any]] = None,
         write_args: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        use_polars: bool = False,
+        cache: bool = False,
     ):
         """Reads data from a given file using Pandas.
 
@@ -33,17 +54,77 @@ class PandasFileSource(WriteableDataSource[pd.DataFrame]):
             format (str): The format of the file. Pandas should support this. Supported
                 values can be found in PandasFileSource.FUNCTIONS
             read_args (Optional[Dict[str, Any]]): Keyword arguments to be passed to `Pandas read_*`.
-                By default no args are passed.
+                By default no args are passed, except for parquet: see PARQUET_READ_DEFAULTS.
+                For large csv files, consider `{"engine": "pyarrow"}` to use pyarrow's multithreaded parser.
+                Note that it infers some types differently than the default engine, e.g. dates.
             write_args (Optional[Dict[str, Any]]): Keyword arguments to be passed to `Pandas to_*`.
-                By default no args are passed.
+                By default no args are passed, except for parquet: see PARQUET_WRITE_DEFAULTS.
+            columns (Optional[List[str]]): The columns to read. For csv, excel and parquet files only
+                these columns are read from disk, which can save a lot of I/O. Other formats are read
+                completely and then filtered. A column selection in `read_args` takes precedence.
+                By default all columns are read.
+            use_polars (bool): Read csv and parquet files using polars' multithreaded readers and convert
+                the result to Pandas. This requires polars to be installed, e.g. through
+                `pytalog-pandas[polars]`. `read_args` are passed to `polars.read_*` in this case.
+                Defaults to False.
+            cache (bool): Keep parquet files in memory as Arrow tables after the first read, so
+                repeated reads only need to convert them to Pandas. The file is memory-mapped while
+                reading. The cache is keyed by the file's modification time, so changes on disk are
+                picked up. Every read returns a new DataFrame, so it can be modified safely. Only
+                `columns` is used from `read_args` in this case. Defaults to False.
+
+        Raises:
+            ValueError: If `format` is not supported.
         """
         super().__init__()
-        assert format in self.PANDAS_IO_FUNCTIONS, f"`{format}` is not a supported format for Pandas!"
+        if format not in self.PANDAS_IO_FUNCTIONS:
+            raise ValueError(f"`{format}` is not a supported format for Pandas!")
 
         self.path = path
         self.format = format
         self.read_args = {} if read_args is None else read_args
         self.write_args = {} if write_args is None else write_args
+        self.columns = columns
+        self.use_polars = use_polars
+        self.cache = cache
+
+    def _get_read_args(self) -> Dict[str, Any]:
+        """Get the keyword arguments for the read function, including defaults and the column selection.
+
+        Returns:
+            Dict[str, Any]: `read_args`, with `columns` added if the format supports it.
+        """
+        read_args = self.read_args
+        if self.format == "parquet" and "engine" not in read_args:
+            read_args = {**self.PARQUET_READ_DEFAULTS, **read_args}
+
+        column_arg = self.COLUMN_ARGS.get(self.format)
+        if self.columns is None or column_arg is None or column_arg in read_args:
+            return read_args
+        return {**read_args, column_arg: self.columns}
+
+    def _get_write_args(self) -> Dict[str, Any]:
+        """Get the keyword arguments for the write function, including defaults.
+
+        Returns:
+            Dict[str, Any]: `write_args`, with format specific defaults added.
+        """
+        if self.format == "parquet":
+            return {**self.PARQUET_WRITE_DEFAULTS, **self.write_args}
+        return self.write_args
+
+    def _select_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Select `columns` from a DataFrame read from a format that can't select them while reading.
+
+        Args:
+            df (pd.DataFrame): The DataFrame as read from disk.
+
+        Returns:
+            pd.DataFrame: `df`, limited to `columns` if required.
+        """
+        if self.columns is None or self.format in self.COLUMN_ARGS:
+            return df
+        return df[self.columns]
 
     def read(self) -> pd.DataFrame:
         """Use the provided arguments to call `read_sql`.
@@ -51,14 +132,159 @@ class PandasFileSource(WriteableDataSource[pd.DataFrame]):
         Returns:
             pd.DataFrame: The result of the provided query.
         """
+        if self.cache and self.format == "parquet":
+            columns = self._get_read_args().get("columns")
+            table = _read_arrow_table(
+                os.path.abspath(self.path),
+                os.stat(self.path).st_mtime_ns,
+                None if columns is None else tuple(columns),
+            )
+            # Converting without split_blocks copies the data, so the result is writeable and owned by the caller.
+            return table.to_pandas()
+
+        if self.use_polars and self.format in self.POLARS_FORMATS:
+            return self._read_with_polars()
+
         read_func, _ = self.PANDAS_IO_FUNCTIONS[self.format]
-        return read_func(self.path, **self.read_args)
+        return self._select_columns(read_func(self.path, **self._get_read_args()))
+
+    def _read_with_polars(self) -> pd.DataFrame:
+        """Read the file using polars and convert the result to Pandas.
+
+        Returns:
+            pd.DataFrame: The contents of the file.
+        """
+        import polars as pl
+
+        read_args = self.read_args
+        if self.columns is not None and "columns" not in read_args:
+            read_args = {**read_args, "columns": self.columns}
+
+        if self.format == "csv":
+            return pl.read_csv(self.path, **read_args).to_pandas()
+        return pl.read_parquet(self.path, **read_args).to_pandas()
+
+    def iter_read(self, batch_size: int = 65536) -> Iterator[pd.DataFrame]:
+        """Read the file in batches of at most `batch_size` rows.
+
+        Parquet files are read batch by batch using pyarrow, CSV files using `chunksize`.
+        For parquet files, only the `columns` and `storage_options` entries of `read_args` are used.
+        Local parquet files are memory-mapped, remote files (e.g. `s3://...`) are opened through
+        fsspec like Pandas does, which requires fsspec to be installed.
+        A `chunksize` in `read_args` takes precedence over `batch_size` for CSV files.
+        Other formats and CSV files read with the pyarrow engine, which doesn't support
+        `chunksize`, are read in one go.
+
+        Args:
+            batch_size (int): The maximum number of rows per batch.
+
+        Yields:
+            pd.DataFrame: Batches of the file.
+        """
+        read_args = self._get_read_args()
+        if self.format == "parquet":
+            columns = read_args.get("columns")
+            if "://" not in str(self.path):
+                yield from _iter_parquet_batches(self.path, batch_size, columns, memory_map=True)
+            else:
+                import fsspec
+
+                with fsspec.open(self.path, "rb", **(read_args.get("storage_options") or {})) as file:
+                    yield from _iter_parquet_batches(file, batch_size, columns, memory_map=False)
+        elif self.format == "csv" and read_args.get("engine") != "pyarrow":
+            with pd.read_csv(self.path, **{"chunksize": batch_size, **read_args}) as reader:
+                yield from reader
+        else:
+            yield from super().iter_read(batch_size)
 
     def write(self, data: pd.DataFrame) -> None:
         """Writes the given data to the given file.
 
+        If `row_group_size` is part of the `write_args` of a parquet file, the data is converted and
+        written one row group at a time using pyarrow's ParquetWriter. This limits peak memory usage
+        for large DataFrames. In this case the index is not written and the other `write_args` are
+        passed to `pyarrow.parquet.ParquetWriter`.
+
         Args:
             data (pd.DataFrame): The DataFrame to be written.
         """
+        write_args = self._get_write_args()
+        if self.format == "parquet" and "row_group_size" in write_args:
+            self._write_parquet_in_row_groups(data, write_args)
+            return
+
         _, write_func = self.PANDAS_IO_FUNCTIONS[self.format]
-        write_func(data, self.path, **self.write_args)
+        write_func(data, self.path, **write_args)
+
+    def _write_parquet_in_row_groups(self, data: pd.DataFrame, write_args: Dict[str, Any]) -> None:
+        """Write a DataFrame to parquet, converting it to Arrow one row group at a time.
+
+        Args:
+            data (pd.DataFrame): The DataFrame to be written.
+            write_args (Dict[str, Any]): The write arguments, including `row_group_size`.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer_args = {k: v for k, v in write_args.items() if k not in ("row_group_size", "engine")}
+        row_group_size = write_args["row_group_size"]
+        schema = pa.Schema.from_pandas(data, preserve_index=False)
+
+        with pq.ParquetWriter(self.path, schema, **writer_args) as writer:
+            for start in range(0, len(data), row_group_size):
+                end = start + row_group_size
+                chunk = data.iloc[start:end]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def _iter_parquet_batches(
+    source: Any, batch_size: int, columns: Optional[List[str]], memory_map: bool
+) -> Iterator[pd.DataFrame]:
+    """Read a parquet file batch by batch using pyarrow.
+
+    Batches don't carry the pandas metadata of the file, so a stored RangeIndex is rebuilt here to continue
+    across batches instead of restarting at 0 for every batch.
+
+    Args:
+        source (Any): The path to the file, or an opened binary file.
+        batch_size (int): The maximum number of rows per batch.
+        columns (Optional[List[str]]): The columns to read. None reads all columns.
+        memory_map (bool): Memory-map the file. Only possible for local paths.
+
+    Yields:
+        pd.DataFrame: Batches of the file.
+    """
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(source, memory_map=memory_map)
+    pandas_metadata = parquet_file.schema_arrow.pandas_metadata or {}
+    index_columns = pandas_metadata.get("index_columns", [])
+    range_index = index_columns[0] if len(index_columns) == 1 and isinstance(index_columns[0], dict) else None
+
+    offset = 0
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        data = batch.to_pandas()
+        if range_index is not None and range_index.get("kind") == "range":
+            start = range_index["start"] + range_index["step"] * offset
+            data.index = pd.RangeIndex(
+                start, start + range_index["step"] * len(data), range_index["step"], name=range_index["name"]
+            )
+        offset += len(data)
+        yield data
+
+
+@functools.lru_cache(maxsize=4)
+def _read_arrow_table(path: str, mtime_ns: int, columns: Optional[Tuple[str, ...]]) -> "pa.Table":
+    """Read a parquet file as a memory-mapped Arrow table, caching the result.
+
+    Args:
+        path (str): The absolute path to the file.
+        mtime_ns (int): The modification time of the file. Only used to invalidate the cache.
+        columns (Optional[Tuple[str, ...]]): The columns to read. None reads all columns.
+
+    Returns:
+        pa.Table: The contents of the file.
+    """
+    import pyarrow.parquet as pq
+
+    return pq.read_table(path, columns=None if columns is None else list(columns), memory_map=True)
@@ -0,0 +1 @@
+from .numeric import NumericValidator
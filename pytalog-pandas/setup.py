@@ -1,7 +1,7 @@
 from setuptools import find_namespace_packages, setup
 
 if __name__ == "__main__":
-    version = "0.0.1"
+    version = "0.0.2"
 
     deps = [
         f"pytalog-base=={version}",
@@ -10,12 +10,19 @@ if __name__ == "__main__":
         "pyarrow>=14.0.1",
         "numpy<2.0",
     ]
+    polars_deps = ["polars>=0.20.0"]
+    numba_deps = ["numba>=0.58.0"]
     strict_deps = [s.replace(">=", "==") for s in deps]
 
     setup(
         name="pytalog-pandas",
         install_requires=deps,
-        extras_require={"dev": strict_deps, "strict": strict_deps},
+        extras_require={
+            "dev": strict_deps + polars_deps + numba_deps,
+            "strict": strict_deps,
+            "polars": polars_deps,
+            "numba": numba_deps,
+        },
         packages=find_namespace_packages(include=["pytalog.*"]),
         version=version,
     )
@@ -12,10 +12,14 @@ def guarantee_spark(spark: Optional[SparkSession] = None) -> SparkSession:
     Args:
         spark (Optional[SparkSession], optional): _description_. Defaults to None.
 
+    Raises:
+        RuntimeError: If no SparkSession was given and none is active.
+
     Returns:
         SparkSession: _description_
     """
     if spark is None:
         spark = SparkSession.getActiveSession()
-    assert spark is not None, "SparkSession was not properly initialised."
+    if spark is None:
+        raise RuntimeError("SparkSession was not properly initialised.")
     return spark
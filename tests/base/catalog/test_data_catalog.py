@@ -1,13 +1,20 @@
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock
+from typing import Any
+from unittest.mock import patch
 
 import pandas as pd
 from pandas.testing import assert_frame_equal
-from pytest import mark
+from pytest import fixture, mark, raises
 
 from pytalog.base.catalog import Catalog, DataSet
+from pytalog.base.catalog.catalog import _CATALOG_CACHE, _is_valid_parseable_object, _parse_object
 from pytalog.base.data_sources.data_source import DataSource
-from tests.utils import pytest_assert
+from pytalog.base.validation import ValidationSet
+from tests.utils import full_match
 
 
 class DummyDataSource(DataSource[int]):
@@ -33,6 +40,31 @@ class PreInitSource(DataSource[float]):
         return self.a + self.alt["b"]
 
 
+@fixture(scope="module")
+def config_dir() -> Path:
+    return Path(__file__).parent.resolve()
+
+
+@fixture(scope="module")
+def expected_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "x": [1.0, 2.0],
+            "y": ["a", "b"],
+        }
+    )
+
+
+class RecordingValidationSet(ValidationSet):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = []
+
+    def validate_data(self, name: str, data: Any) -> Any:
+        self.calls.append((name, data))
+        return data
+
+
 def dummy_func(a, b, *c, **d):
     return a + b
 
@@ -56,8 +88,52 @@ class Test_Catalog:
         assert expected["a"] == result["a"]
         assert expected["b"] == result["b"]
 
+    def test_read_all_parallel(self):
+        dss = Catalog[int](
+            {
+                "a": DummyDataSource(5),
+                "b": DummyDataSource(10),
+                "c": DummyDataSource(15),
+            },
+            max_read_workers=2,
+        )
+
+        result = dss.read_all()
+        expected = {
+            "a": 5,
+            "b": 10,
+            "c": 15,
+        }
+        assert isinstance(result, DataSet)
+        assert expected == result
+
+    @mark.parametrize("max_read_workers", [0, 4])
+    def test_read_all_max_workers_override(self, max_read_workers: int):
+        dss = Catalog[int](
+            {
+                "a": DummyDataSource(5),
+                "b": DummyDataSource(10),
+            },
+            max_read_workers=max_read_workers,
+        )
+
+        with patch("pytalog.base.catalog.catalog.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as executor:
+            result = dss.read_all(max_workers=2)
+
+        executor.assert_called_once_with(max_workers=2)
+        assert result == {"a": 5, "b": 10}
+
+    def test_read_all_sequential_override(self):
+        dss = Catalog[int]({"a": DummyDataSource(5), "b": DummyDataSource(10)}, max_read_workers=4)
+
+        with patch("pytalog.base.catalog.catalog.ThreadPoolExecutor") as executor:
+            result = dss.read_all(max_workers=0)
+
+        executor.assert_not_called()
+        assert result == {"a": 5, "b": 10}
+
     def test_read_with_skip(self):
-        validation_set = MagicMock()
+        validation_set = RecordingValidationSet()
         dss = Catalog[int](
             {
                 "a": DummyDataSource(5),
@@ -68,10 +144,10 @@ class Test_Catalog:
 
         result = dss.read("a", skip_validation=True)
         assert result == 5
-        validation_set.validate_data.assert_not_called()
+        assert validation_set.calls == []
 
     def test_read(self):
-        validation_set = MagicMock()
+        validation_set = RecordingValidationSet()
         dss = Catalog[int](
             {
                 "a": DummyDataSource(5),
@@ -82,7 +158,7 @@ class Test_Catalog:
 
         result = dss.read("a")
         assert result == 5
-        validation_set.validate_data.assert_called_once_with("a", 5)
+        assert validation_set.calls == [("a", 5)]
 
     @mark.parametrize(
         ["expectation", "dictionary"],
@@ -96,46 +172,92 @@ class Test_Catalog:
         ],
     )
     def test_is_valid_parseable_object(self, expectation: bool, dictionary: dict):
-        result = Catalog._is_valid_parseable_object(dictionary)
+        result = _is_valid_parseable_object(dictionary)
         assert result == expectation
 
-    def test_load_class(self):
-        path = "pytalog.base.data_sources.DataSource"
-        result = Catalog._load_class(path)
-
-        assert result == DataSource
-
-    def test_load_class_assert(self):
-        path = "pytalog.base.data_sources.DataSource:read:failure"
-
-        with pytest_assert(AssertionError, f"{path}: Catalogs do not accept paths with more than 1 `:`"):
-            Catalog._load_class(path)
+    def test_from_yaml_during_package_import(self, tmp_path: Path):
+        # Loading a catalog while its own package is being imported should not deadlock.
+        package = tmp_path / "catalog_package"
+        package.mkdir()
+        (package / "helpers.py").write_text("VALUE = 3\n")
+        for name in ["sources", "other"]:
+            (package / f"{name}.py").write_text(
+                "from catalog_package import helpers\n"
+                "from pytalog.base.data_sources.data_source import DataSource\n\n\n"
+                "class Source(DataSource[int]):\n"
+                "    def read(self) -> int:\n"
+                "        return helpers.VALUE\n"
+            )
+        (package / "catalog.yml").write_text(
+            "a:\n  callable: catalog_package.sources.Source\n  args: {}\n"
+            "b:\n  callable: catalog_package.other.Source\n  args: {}\n"
+        )
+        (package / "__init__.py").write_text(
+            "from pathlib import Path\n"
+            "from pytalog.base.catalog import Catalog\n"
+            "from catalog_package import helpers\n\n"
+            "CATALOG = Catalog.from_yaml(Path(__file__).parent / 'catalog.yml')\n"
+        )
 
-    def test_load_class_with_method(self):
-        path = "pytalog.base.data_sources.DataSource:read"
-        result = Catalog._load_class(path)
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(tmp_path), os.getcwd()])}
+        result = subprocess.run(
+            [sys.executable, "-c", "import catalog_package; print(catalog_package.CATALOG.read('b'))"],
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
 
-        assert result == DataSource.read
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "3"
 
     def test_parse_object(self):
         v = 10
         dct = {"callable": "tests.base.catalog.test_data_catalog.DummyDataSource", "args": {"v": v}}
-        result = Catalog._parse_object(dct, create_object=True)
+        result = _parse_object(dct, create_object=True)
 
         assert isinstance(result, DummyDataSource)
         assert result.v == v
 
+    def test_parse_object_invalid(self):
+        with raises(
+            ValueError, match=full_match("Catalog: any dictionary parsed should have a `callable` and `args` entry.")
+        ):
+            _parse_object({"callable": "tests.base.catalog.test_data_catalog.DummyDataSource"}, create_object=True)
+
+    def test_parse_object_invalid_nested_args(self):
+        dct = {
+            "callable": "tests.base.catalog.test_data_catalog.PreInitSource",
+            "args": {
+                "a": 1,
+                "alt": {"callable": "builtins.dict", "args": {"b": {"callable": "builtins.dict", "args": []}}},
+            },
+        }
+
+        with raises(TypeError, match=full_match("args.alt.args.b: Arguments to a parseable object should be a dict.")):
+            _parse_object(dct, create_object=True)
+
+    def test_deeply_nested_parse_object(self):
+        dct = {"callable": "builtins.dict", "args": {"depth": 0}}
+        for depth in range(1, 2000):
+            dct = {"callable": "builtins.dict", "args": {"depth": depth, "child": dct}}
+
+        result = _parse_object(dct, create_object=True)
+
+        assert result["depth"] == 1999
+        assert result["child"]["depth"] == 1998
+
     def test_nested_parse_object(self):
         p = 2
         dct = {"callable": "tests.base.catalog.test_data_catalog.DummyDataSource:dummy_method", "args": {"p": p}}
-        result = Catalog._parse_object(dct, create_object=True)
+        result = _parse_object(dct, create_object=True)
 
         assert result == 7
 
     def test_parse_object_uncreated(self):
         p = 2
         dct = {"callable": "tests.base.catalog.test_data_catalog.DummyDataSource", "args": {"p": p}}
-        cl, args = Catalog._parse_object(dct, create_object=False)
+        cl, args = _parse_object(dct, create_object=False)
 
         assert cl == DummyDataSource
         assert args == {"p": p}
@@ -143,17 +265,26 @@ class Test_Catalog:
     def test_pre_initialised_parse_object(self):
         a = 2
         dct = {"callable": "tests.base.catalog.test_data_catalog.PreInitSource", "args": {}}
-        result = Catalog._parse_object(dct, create_object=True, initialised_parameters={"alt": {"b": 932}, "a": a})
+        result = _parse_object(dct, create_object=True, initialised_parameters={"alt": {"b": 932}, "a": a})
 
         assert isinstance(result, PreInitSource)
         assert result.read() == 932 + a
 
+    def test_pre_initialised_nested_parse_object(self):
+        dct = {
+            "callable": "tests.base.catalog.test_data_catalog.PreInitSource",
+            "args": {"a": {"callable": "tests.base.catalog.test_data_catalog.dummy_func", "args": {"a": 3}}},
+        }
+        result = _parse_object(dct, create_object=True, initialised_parameters={"alt": {"b": 932}, "b": 4})
+
+        assert isinstance(result, PreInitSource)
+        assert result.a == 3 + 4
+        assert result.read() == 932 + 3 + 4
+
     def test_pre_initialised_parse_object_ignore_unnecessary_values(self):
         a = 2
         dct = {"callable": "tests.base.catalog.test_data_catalog.PreInitSource", "args": {}}
-        result = Catalog._parse_object(
-            dct, create_object=True, initialised_parameters={"alt": {"b": 932}, "a": a, "c": 32984}
-        )
+        result = _parse_object(dct, create_object=True, initialised_parameters={"alt": {"b": 932}, "a": a, "c": 32984})
 
         assert isinstance(result, PreInitSource)
         assert result.read() == 932 + a
@@ -162,7 +293,7 @@ class Test_Catalog:
         a = 2
         #  'a' in dict is more important.
         dct = {"callable": "tests.base.catalog.test_data_catalog.PreInitSource", "args": {"a": a}}
-        result = Catalog._parse_object(dct, create_object=True, initialised_parameters={"alt": {"b": 932}, "a": 23789})
+        result = _parse_object(dct, create_object=True, initialised_parameters={"alt": {"b": 932}, "a": 23789})
 
         assert isinstance(result, PreInitSource)
         assert result.read() == 932 + a
@@ -171,12 +302,12 @@ class Test_Catalog:
         a = 2
         b = 9
         dct = {"callable": "tests.base.catalog.test_data_catalog.dummy_func", "args": {}}
-        result = Catalog._parse_object(dct, create_object=True, initialised_parameters={"a": a, "b": b, "c": 2, "d": 0})
+        result = _parse_object(dct, create_object=True, initialised_parameters={"a": a, "b": b, "c": 2, "d": 0})
 
         assert result == b + a
 
-    def test_from_yaml(self):
-        path = Path(__file__).parent / "config.yml"
+    def test_from_yaml(self, config_dir: Path, expected_df: pd.DataFrame):
+        path = config_dir / "config.yml"
 
         catalog = Catalog.from_yaml(path)
 
@@ -190,16 +321,46 @@ class Test_Catalog:
         assert sql_source.con == "http://<your database url>"
 
         # dataframe
-        expected_df = pd.DataFrame(
-            {
-                "x": [1.0, 2.0],
-                "y": ["a", "b"],
-            }
-        )
         assert_frame_equal(expected_df, catalog["dataframe"].read())
 
-    def test_from_yaml_with_jinja(self):
-        path = Path(__file__).parent / "config_with_jinja.yml"
+    def test_from_yaml_cached(self, config_dir: Path):
+        path = config_dir / "config_with_validations.yml"
+        _CATALOG_CACHE.clear()
+
+        first = Catalog.from_yaml(path, use_cache=True)
+        second = Catalog.from_yaml(path, use_cache=True)
+
+        assert len(_CATALOG_CACHE) == 1
+        assert first is not second
+        assert first.validation_set is not second.validation_set
+        assert first["dataframe"] is second["dataframe"]
+        assert first.validation_set == second.validation_set
+
+        second.pop("dataframe")
+        assert "dataframe" in Catalog.from_yaml(path, use_cache=True)
+        _CATALOG_CACHE.clear()
+
+    def test_from_yaml_cached_from_threads(self, config_dir: Path):
+        path = config_dir / "config_with_validations.yml"
+        _CATALOG_CACHE.clear()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            catalogs = list(executor.map(lambda _: Catalog.from_yaml(path, use_cache=True), range(32)))
+
+        assert len(_CATALOG_CACHE) == 1
+        assert all(catalog["dataframe"] is catalogs[0]["dataframe"] for catalog in catalogs)
+        _CATALOG_CACHE.clear()
+
+    def test_from_yaml_cache_ignored_with_initialised_parameters(self, config_dir: Path):
+        path = config_dir / "config.yml"
+        _CATALOG_CACHE.clear()
+
+        Catalog.from_yaml(path, initialised_parameters={"a": 1}, use_cache=True)
+
+        assert len(_CATALOG_CACHE) == 0
+
+    def test_from_yaml_with_jinja(self, config_dir: Path):
+        path = config_dir / "config_with_jinja.yml"
 
         params = {
             "pandas_sql": {"sql": "select * from database.table", "con": "http://<your database url>"},
@@ -225,8 +386,8 @@ class Test_Catalog:
         )
         assert_frame_equal(expected_df, catalog["dataframe"].read())
 
-    def test_from_yaml_with_jinja_and_preinitialised_values(self):
-        path = Path(__file__).parent / "config_with_jinja_and_inits.yml"
+    def test_from_yaml_with_jinja_and_preinitialised_values(self, config_dir: Path):
+        path = config_dir / "config_with_jinja_and_inits.yml"
 
         params = {
             "pandas_sql": {"sql": "select * from database.table", "con": "http://<your database url>"},
@@ -250,8 +411,8 @@ class Test_Catalog:
         expected_result = params["extra"]["a"] + initialised["alt"]["b"]
         assert expected_result == catalog["extra"].read()
 
-    def test_from_yaml_with_validation(self):
-        path = Path(__file__).parent / "config_with_validations.yml"
+    def test_from_yaml_with_validation(self, config_dir: Path, expected_df: pd.DataFrame):
+        path = config_dir / "config_with_validations.yml"
 
         catalog = Catalog.from_yaml(path)
 
@@ -266,15 +427,8 @@ class Test_Catalog:
         assert sql_source.con == "http://<your database url>"
 
         # dataframe
-        expected_df = pd.DataFrame(
-            {
-                "x": [1.0, 2.0],
-                "y": ["a", "b"],
-            }
-        )
-
         df = catalog.read("dataframe")
         assert_frame_equal(expected_df, df)
 
-        with pytest_assert(AssertionError, "Nope!"):
+        with raises(AssertionError, match=full_match("Nope!")):
             catalog.read("bad_dataframe")
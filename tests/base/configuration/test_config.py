@@ -9,9 +9,14 @@ from pytalog.base.configuration.config import Configuration
 from pytalog.pd.data_sources.sql import SqlSource
 
 
-@fixture
+@fixture(scope="module")
 def this_folder() -> Path:
-    return Path(__file__).parent
+    return Path(__file__).parent.resolve()
+
+
+@fixture(scope="module")
+def expected_df() -> pd.DataFrame:
+    return pd.DataFrame({"x": [1.0, 9.0], "y": ["a", "b"]})
 
 
 @dataclass
@@ -39,7 +44,7 @@ class DummyConfig:
 
 
 class TestConfiguration:
-    def test_config(self, this_folder: Path):
+    def test_config(self, this_folder: Path, expected_df: pd.DataFrame):
         config = Configuration.from_hierarchical_config(
             parameters_paths=[this_folder / "base_config.yml"],
             catalog_path=this_folder / "catalog.yml",
@@ -59,10 +64,9 @@ class TestConfiguration:
         assert sql.con == "http://<your database url>"
 
         x = config.catalog.read("dataframe")
-        expected_df = pd.DataFrame({"x": [1.0, 9.0], "y": ["a", "b"]})
         pd.testing.assert_frame_equal(expected_df, x)
 
-    def test_config_multi_path(self, this_folder: Path):
+    def test_config_multi_path(self, this_folder: Path, expected_df: pd.DataFrame):
         config = Configuration.from_hierarchical_config(
             parameters_paths=[this_folder / "base_config.yml", this_folder / "extra_config.yml"],
             catalog_path=this_folder / "catalog.yml",
@@ -82,7 +86,6 @@ class TestConfiguration:
         assert sql.con == "http://<your database url>"
 
         x = config.catalog.read("dataframe")
-        expected_df = pd.DataFrame({"x": [1.0, 9.0], "y": ["a", "b"]})
         pd.testing.assert_frame_equal(expected_df, x)
 
     def test_config_optional_path(self, this_folder: Path):
@@ -109,7 +112,7 @@ class TestConfiguration:
         expected_df = pd.DataFrame({"x": [1.0, 3.4], "y": ["a", "b"]})
         pd.testing.assert_frame_equal(expected_df, x)
 
-    def test_config_converter(self, this_folder: Path):
+    def test_config_converter(self, this_folder: Path, expected_df: pd.DataFrame):
         config = Configuration[DummyConfig].from_hierarchical_config(
             parameters_paths=[this_folder / "base_config.yml"],
             catalog_path=this_folder / "catalog.yml",
@@ -130,7 +133,6 @@ class TestConfiguration:
         assert sql.con == "http://<your database url>"
 
         x = config.catalog.read("dataframe")
-        expected_df = pd.DataFrame({"x": [1.0, 9.0], "y": ["a", "b"]})
         pd.testing.assert_frame_equal(expected_df, x)
 
     def test_config_initialised_params(self, this_folder: Path):
@@ -154,3 +156,14 @@ class TestConfiguration:
             },
             initialised_parameters=ip,
         )
+
+    def test_nested_update(self):
+        d = {"a": 1, "b": {"c": 2, "d": {"e": 3}}, "f": 4}
+        u = {"b": {"d": {"g": 5}, "h": 6}, "f": {"i": 7}}
+
+        result = Configuration._nested_update(d, u)
+
+        assert result is d
+        assert result == {"a": 1, "b": {"c": 2, "d": {"e": 3, "g": 5}, "h": 6}, "f": {"i": 7}}
+        # Non-overlapping parts of u are moved into the result without copying.
+        assert result["f"] is u["f"]
@@ -0,0 +1,33 @@
+from pytest import raises
+
+from pytalog.base.data_sources import DataSource
+from pytalog.base.utils import load_callable
+from tests.utils import full_match
+
+
+class TestLoadCallable:
+    def test_load_callable(self):
+        path = "pytalog.base.data_sources.DataSource"
+        result = load_callable(path)
+
+        assert result == DataSource
+
+    def test_load_callable_with_method(self):
+        path = "pytalog.base.data_sources.DataSource:read"
+        result = load_callable(path)
+
+        assert result == DataSource.read
+
+    def test_load_callable_assert(self):
+        path = "pytalog.base.data_sources.DataSource:read:failure"
+
+        with raises(ValueError, match=full_match(f"{path}: Import paths can not contain more than 1 `:`")):
+            load_callable(path)
+
+    def test_load_callable_cached(self):
+        path = "pytalog.base.data_sources.DataSource"
+        load_callable.cache_clear()
+
+        assert load_callable(path) is DataSource
+        assert load_callable(path) is DataSource
+        assert load_callable.cache_info().hits == 1
@@ -0,0 +1,283 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+from jinja2 import FileSystemBytecodeCache
+from pytest import fixture, mark, raises
+
+from pytalog.base.utils import load_yaml
+from pytalog.base.utils.load_yaml import _apply_jinja, _hash_params, clear_cache, load_yaml_with_jinja
+
+
+@fixture(autouse=True)
+def empty_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+@fixture
+def yaml_file(tmp_path: Path) -> Path:
+    path = tmp_path / "params.yml"
+    path.write_text("a:\n  b: {{ x }}\n  c:\n    - 1\n    - 2\n")
+    return path
+
+
+class TestLoadYamlWithJinja:
+    def test_load(self, yaml_file: Path):
+        result = load_yaml_with_jinja(yaml_file, params={"x": 3})
+
+        assert result == {"a": {"b": 3, "c": [1, 2]}}
+
+    def test_params_not_modified(self, yaml_file: Path):
+        params = {"x": 3, "y": {"z": [1]}}
+        load_yaml_with_jinja(yaml_file, params=params)
+
+        assert params == {"x": 3, "y": {"z": [1]}}
+
+    def test_cached(self, yaml_file: Path):
+        load_yaml_with_jinja(yaml_file, params={"x": 3})
+        assert len(load_yaml._YAML_CACHE) == 1
+
+        load_yaml_with_jinja(yaml_file, params={"x": 3})
+        assert len(load_yaml._YAML_CACHE) == 1
+
+        load_yaml_with_jinja(yaml_file, params={"x": 4})
+        assert len(load_yaml._YAML_CACHE) == 2
+
+    def test_cached_from_threads(self, yaml_file: Path, monkeypatch):
+        monkeypatch.setattr(load_yaml, "_YAML_CACHE_SIZE", 4)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: load_yaml_with_jinja(yaml_file, params={"x": i % 8}), range(256)))
+
+        assert [result["a"]["b"] for result in results] == [i % 8 for i in range(256)]
+        assert len(load_yaml._YAML_CACHE) == 4
+
+    @mark.parametrize(
+        ["params", "other_params"],
+        [
+            [{"x": (1, 2)}, {"x": [1, 2]}],
+            [{"x": {1: "a"}}, {"x": {"1": "a"}}],
+            [{"x": date(2020, 1, 1)}, {"x": "2020-01-01"}],
+        ],
+    )
+    def test_params_of_different_types_not_mixed_up(self, tmp_path: Path, params: dict, other_params: dict):
+        path = tmp_path / "params.yml"
+        path.write_text("a: {{ x | string | tojson }}\n")
+
+        result = load_yaml_with_jinja(path, params=params)
+        other_result = load_yaml_with_jinja(path, params=other_params)
+
+        assert result == {"a": str(params["x"])}
+        assert other_result == {"a": str(other_params["x"])}
+        assert len(load_yaml._YAML_CACHE) == 1
+
+    def test_cache_key_uses_absolute_path(self, yaml_file: Path, monkeypatch):
+        load_yaml_with_jinja(yaml_file, params={"x": 3})
+        monkeypatch.chdir(yaml_file.parent)
+        load_yaml_with_jinja(yaml_file.name, params={"x": 3})
+
+        assert len(load_yaml._YAML_CACHE) == 1
+
+    def test_cache_returns_copies(self, yaml_file: Path):
+        result = load_yaml_with_jinja(yaml_file, params={"x": 3})
+        result["a"]["c"].append(3)
+
+        assert load_yaml_with_jinja(yaml_file, params={"x": 3}) == {"a": {"b": 3, "c": [1, 2]}}
+
+    def test_cache_copies_preserve_shared_and_recursive_values(self, tmp_path: Path):
+        path = tmp_path / "anchors.yml"
+        path.write_text("a: &x [1, 2]\nb: *x\nc: &y\n  d: *y\ne: 2020-01-01\n")
+
+        load_yaml_with_jinja(path)
+        result = load_yaml_with_jinja(path)
+
+        assert result["a"] is result["b"]
+        assert result["c"]["d"] is result["c"]
+        assert result["e"] == date(2020, 1, 1)
+        assert result["a"] is not load_yaml._YAML_CACHE[next(iter(load_yaml._YAML_CACHE))]["a"]
+
+    def test_cache_invalidated_on_change(self, yaml_file: Path):
+        assert load_yaml_with_jinja(yaml_file, params={"x": 3}) == {"a": {"b": 3, "c": [1, 2]}}
+
+        stat = yaml_file.stat()
+        yaml_file.write_text("a: {{ x }}\n")
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_yaml_with_jinja(yaml_file, params={"x": 3}) == {"a": 3}
+
+    def test_cache_invalidated_on_size_change(self, yaml_file: Path):
+        assert load_yaml_with_jinja(yaml_file, params={"x": 3}) == {"a": {"b": 3, "c": [1, 2]}}
+
+        stat = yaml_file.stat()
+        yaml_file.write_text("a: {{ x }}\n")
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_yaml_with_jinja(yaml_file, params={"x": 3}) == {"a": 3}
+
+    def test_template_compiled_once(self, yaml_file: Path, tmp_path: Path):
+        copy_file = tmp_path / "copy.yml"
+        copy_file.write_text(yaml_file.read_text())
+
+        load_yaml_with_jinja(yaml_file, params={"x": 3})
+        load_yaml_with_jinja(copy_file, params={"x": 4})
+
+        assert len(load_yaml._TEMPLATE_CACHE) == 1
+
+    def test_skip_jinja_without_markers(self, tmp_path: Path):
+        path = tmp_path / "plain.yml"
+        path.write_text("a:\n  b: 3\n")
+
+        assert load_yaml_with_jinja(path, params={"x": 3}) == {"a": {"b": 3}}
+        assert len(load_yaml._TEMPLATE_CACHE) == 0
+
+    def test_jinja_env_shared(self):
+        assert load_yaml._get_jinja_env() is load_yaml._get_jinja_env()
+
+    def test_c_loader_used_if_available(self):
+        assert load_yaml._Loader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    def test_loader_is_safe(self, tmp_path: Path):
+        path = tmp_path / "unsafe.yml"
+        path.write_text("a: !!python/object/apply:os.getcwd []\n")
+
+        with raises(yaml.constructor.ConstructorError):
+            load_yaml_with_jinja(path)
+
+    def test_jinja_comments_rendered(self, tmp_path: Path):
+        path = tmp_path / "comment.yml"
+        path.write_text("a: 3 {# a comment #}\n")
+
+        assert load_yaml_with_jinja(path) == {"a": 3}
+
+
+class TestHashParams:
+    def test_stable(self):
+        assert _hash_params({"a": 1, "b": [1, 2]}) == _hash_params({"b": [1, 2], "a": 1})
+
+    @mark.parametrize("params", [{"x": (1, 2)}, {"x": {1: "a"}}, {"x": date(2020, 1, 1)}, {1: "a", "b": 2}])
+    def test_not_hashable(self, params: dict):
+        assert _hash_params(params) is None
+
+
+class TestApplyJinja:
+    def test_apply_jinja(self):
+        assert _apply_jinja("a: {{ x }}", {"x": 3}) == "a: 3"
+        assert _apply_jinja(b"a: {{ x }}", {"x": 3}) == "a: 3"
+
+    def test_template_cache_bounded(self, monkeypatch):
+        monkeypatch.setattr(load_yaml, "_TEMPLATE_CACHE_SIZE", 2)
+
+        for i in range(3):
+            _apply_jinja(f"a{i}: {{{{ x }}}}", {"x": 3})
+        _apply_jinja("a1: {{ x }}", {"x": 3})
+        _apply_jinja("a3: {{ x }}", {"x": 3})
+
+        # a0 and a2 were least recently used.
+        expected = [hashlib.blake2b(f"a{i}: {{{{ x }}}}".encode(), digest_size=16).digest() for i in (1, 3)]
+        assert list(load_yaml._TEMPLATE_CACHE) == expected
+
+    def test_template_cache_from_threads(self, monkeypatch):
+        monkeypatch.setattr(load_yaml, "_TEMPLATE_CACHE_SIZE", 4)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: _apply_jinja(f"a{i % 8}: {{{{ x }}}}", {"x": i}), range(256)))
+
+        assert results == [f"a{i % 8}: {i}" for i in range(256)]
+        assert len(load_yaml._TEMPLATE_CACHE) == 4
+
+    def test_skip_without_markers(self):
+        assert _apply_jinja("a: 3", {"x": 3}) == "a: 3"
+        assert _apply_jinja(b"a: 3", {}) == "a: 3"
+        assert len(load_yaml._TEMPLATE_CACHE) == 0
+
+
+class TestDiskCache:
+    @fixture(autouse=True)
+    def enable_disk_cache(self, monkeypatch, tmp_path: Path):
+        monkeypatch.setenv(load_yaml.DISK_CACHE_ENV_VAR, "1")
+        bytecode_dir = tmp_path / "bytecode"
+        bytecode_dir.mkdir()
+        monkeypatch.setattr(load_yaml, "_BYTECODE_CACHE", FileSystemBytecodeCache(str(bytecode_dir)))
+
+    def test_cache_file_written(self, yaml_file: Path):
+        result = load_yaml_with_jinja(yaml_file, params={"x": 3})
+
+        cache_file = yaml_file.parent / "params.yml.cache.json"
+        assert cache_file.exists()
+        assert json.loads(cache_file.read_text())["content"] == result
+
+    def test_cache_file_used(self, yaml_file: Path):
+        load_yaml_with_jinja(yaml_file, params={"x": 3})
+        clear_cache()
+
+        cache_file = yaml_file.parent / "params.yml.cache.json"
+        cached = json.loads(cache_file.read_text())
+        cached["content"] = {"from": "cache"}
+        cache_file.write_text(json.dumps(cached))
+
+        assert load_yaml_with_jinja(yaml_file, params={"x": 3}) == {"from": "cache"}
+
+    def test_cache_file_ignored_for_other_params(self, yaml_file: Path):
+        load_yaml_with_jinja(yaml_file, params={"x": 3})
+        clear_cache()
+
+        assert load_yaml_with_jinja(yaml_file, params={"x": 4}) == {"a": {"b": 4, "c": [1, 2]}}
+
+    def test_cache_file_ignored_if_outdated(self, yaml_file: Path):
+        load_yaml_with_jinja(yaml_file, params={"x": 3})
+        clear_cache()
+
+        cache_file = yaml_file.parent / "params.yml.cache.json"
+        stat = cache_file.stat()
+        yaml_file.write_text("a: {{ x }}\n")
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_yaml_with_jinja(yaml_file, params={"x": 3}) == {"a": 3}
+
+    def test_cache_file_ignored_if_older_file_restored(self, yaml_file: Path):
+        stat = yaml_file.stat()
+        load_yaml_with_jinja(yaml_file, params={"x": 3})
+        clear_cache()
+
+        # E.g. an older version restored from version control: older than the cache file, but different.
+        yaml_file.write_text("a: {{ x }}\n")
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+
+        assert load_yaml_with_jinja(yaml_file, params={"x": 3}) == {"a": 3}
+
+    def test_no_cache_file_for_non_json_content(self, tmp_path: Path):
+        path = tmp_path / "dates.yml"
+        path.write_text("a: 2020-01-01\n1: b\n")
+
+        result = load_yaml_with_jinja(path)
+
+        assert result == {"a": date(2020, 1, 1), 1: "b"}
+        assert not (tmp_path / "dates.yml.cache.json").exists()
+
+    def test_stdlib_json_fallback(self, yaml_file: Path, monkeypatch):
+        monkeypatch.setattr(load_yaml, "_json_loads", json.loads)
+        monkeypatch.setattr(load_yaml, "_json_dumps", load_yaml._stdlib_json_dumps)
+        load_yaml_with_jinja(yaml_file, params={"x": 3})
+        clear_cache()
+
+        assert load_yaml_with_jinja(yaml_file, params={"x": 3}) == {"a": {"b": 3, "c": [1, 2]}}
+        assert json.loads((yaml_file.parent / "params.yml.cache.json").read_text())["content"] == {
+            "a": {"b": 3, "c": [1, 2]}
+        }
+
+    def test_bytecode_cache_used(self, yaml_file: Path, tmp_path: Path):
+        load_yaml_with_jinja(yaml_file, params={"x": 3})
+        assert len(list((tmp_path / "bytecode").iterdir())) == 1
+        clear_cache()
+        (yaml_file.parent / "params.yml.cache.json").unlink()
+
+        with patch.object(load_yaml._get_jinja_env(), "compile") as compile:
+            assert load_yaml_with_jinja(yaml_file, params={"x": 4}) == {"a": {"b": 4, "c": [1, 2]}}
+        compile.assert_not_called()
@@ -1,19 +1,35 @@
-from unittest.mock import MagicMock
+import logging
+from typing import Any
 
 from pytest import fixture
 
 from pytalog.base.validation import ValidationSet
 
 
+class RecordingValidator:
+    __slots__ = ("calls", "name_calls")
+
+    def __init__(self) -> None:
+        self.calls = []
+        self.name_calls = 0
+
+    def validate(self, data: Any) -> None:
+        self.calls.append(data)
+
+    def get_name(self) -> str:
+        self.name_calls += 1
+        return "recording"
+
+
 class TestValidationSet:
     @fixture
     def validations(self) -> ValidationSet:
         return ValidationSet(
             x=[
-                MagicMock(),
-                MagicMock(),
+                RecordingValidator(),
+                RecordingValidator(),
             ],
-            y=[MagicMock()],
+            y=[RecordingValidator()],
         )
 
     def test_not_present(self, validations: ValidationSet):
@@ -21,13 +37,24 @@ class TestValidationSet:
 
         for vals in validations.values():
             for v in vals:
-                v.validate.assert_not_called()
+                assert v.calls == []
 
     def test_multiple_checks(self, validations: ValidationSet):
         data = 3
         validations.validate_data("x", data)
 
         for v in validations["y"]:
-            v.validate.assert_not_called()
+            assert v.calls == []
+        for v in validations["x"]:
+            assert v.calls == [data]
+
+    def test_names_only_fetched_when_logging(self, validations: ValidationSet, caplog):
+        with caplog.at_level(logging.WARNING, logger=validations.logger.name):
+            validations.validate_data("x", 3)
+        for v in validations["x"]:
+            assert v.name_calls == 0
+
+        with caplog.at_level(logging.INFO, logger=validations.logger.name):
+            validations.validate_data("x", 3)
         for v in validations["x"]:
-            v.validate.assert_called_once_with(data)
+            assert v.name_calls == 1
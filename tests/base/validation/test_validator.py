@@ -1,7 +1,9 @@
+import re
 from typing import Any
 
+from pytest import raises
+
 from pytalog.base.validation import Validator, ValidatorObject
-from tests.utils import pytest_assert
 
 
 def dummy_check(i: int, z: int):
@@ -23,9 +25,15 @@ class TestValidator:
 
         validator.validate(2)
 
-        with pytest_assert(AssertionError, "Nope!", exact=False):
+        with raises(AssertionError, match=re.escape("Nope!")):
             validator.validate(10)
 
+    def test_validate_uses_updated_kwargs(self):
+        validator = Validator(callable=dummy_check, z=4)
+        validator.kwargs["z"] = 20
+
+        validator.validate(10)
+
     def test_get_name(self):
         validator = Validator(callable=dummy_check, z=4)
 
@@ -38,7 +46,7 @@ class TestValidatorObject:
 
         validator.validate(2)
 
-        with pytest_assert(AssertionError, "Nope!", exact=False):
+        with raises(AssertionError, match=re.escape("Nope!")):
             validator.validate(10)
 
     def test_get_name(self):
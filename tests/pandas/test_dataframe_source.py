@@ -0,0 +1,33 @@
+import pandas as pd
+from pytest import mark, raises
+
+from pytalog.pd.data_sources import DataFrameSource
+from tests.utils import are_dataframes_equal, full_match
+
+
+class TestDataFrameSource:
+    @mark.parametrize(["copy", "same_object"], [["none", True], ["shallow", False], ["deep", False]])
+    def test_read(self, copy: str, same_object: bool):
+        df = pd.DataFrame({"x": [1, 2, 3]})
+        source = DataFrameSource(df, copy=copy)
+
+        result = source.read()
+
+        assert (result is df) == same_object
+        are_dataframes_equal(df, result)
+
+    def test_deep_copy_is_independent(self):
+        df = pd.DataFrame({"x": [1, 2, 3]})
+        source = DataFrameSource(df, copy="deep")
+
+        result = source.read()
+        result.loc[0, "x"] = 10
+
+        assert df.loc[0, "x"] == 1
+
+    def test_invalid_copy_mode(self):
+        with raises(
+            ValueError,
+            match=full_match("`some` is not a supported copy mode, choose from ('none', 'shallow', 'deep')."),
+        ):
+            DataFrameSource(pd.DataFrame(), copy="some")
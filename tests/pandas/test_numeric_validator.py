@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pandas as pd
+from pytest import importorskip, raises
+
+from pytalog.base.catalog import Catalog
+from pytalog.pd.validation import NumericValidator
+from tests.utils import full_match
+
+
+def all_positive(x):
+    for v in x:
+        if v <= 0:
+            return False
+    return True
+
+
+def x_smaller_than_y(x, y):
+    return (x < y).all()
+
+
+class TestNumericValidator:
+    def test_validate(self):
+        importorskip("numba")
+        validator = NumericValidator(all_positive, columns=["x"], cache=False)
+
+        validator.validate(pd.DataFrame({"x": [1.0, 2.0], "y": ["a", "b"]}))
+
+        with raises(AssertionError, match=full_match("all_positive failed for columns ['x'].")):
+            validator.validate(pd.DataFrame({"x": [1.0, -2.0], "y": ["a", "b"]}))
+
+    def test_validate_multiple_columns(self):
+        importorskip("numba")
+        validator = NumericValidator(x_smaller_than_y, columns=["x", "y"], cache=False)
+
+        validator.validate(pd.DataFrame({"x": [1, 2], "y": [3, 4]}))
+
+        with raises(AssertionError, match=full_match("x_smaller_than_y failed for columns ['x', 'y'].")):
+            validator.validate(pd.DataFrame({"x": [1, 5], "y": [3, 4]}))
+
+    def test_get_name(self):
+        importorskip("numba")
+        validator = NumericValidator(all_positive, columns=["x"], cache=False)
+
+        assert validator.get_name() == "all_positive"
+
+    def test_kernel_import_path(self):
+        importorskip("numba")
+        validator = NumericValidator("tests.pandas.test_numeric_validator.all_positive", columns=["x"], cache=False)
+
+        assert validator.kernel is all_positive
+        with raises(AssertionError, match=full_match("all_positive failed for columns ['x'].")):
+            validator.validate(pd.DataFrame({"x": [1.0, -2.0]}))
+
+    def test_from_catalog(self):
+        importorskip("numba")
+        catalog = Catalog.from_yaml(Path(__file__).parent / "config_with_numeric_validation.yml")
+
+        catalog.read("dataframe")
+        with raises(AssertionError, match=full_match("all_positive failed for columns ['x'].")):
+            catalog.read("bad_dataframe")
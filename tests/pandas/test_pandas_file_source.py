@@ -1,17 +1,45 @@
-from tempfile import NamedTemporaryFile
-from unittest.mock import MagicMock
+import os
+from io import BytesIO
+from pathlib import Path
+from typing import Callable
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
-from pytest import mark
+import pyarrow.parquet as pq
+from pytest import fixture, importorskip, mark, param, raises
 
 from pytalog.pd.data_sources import PandasFileSource
-from tests.utils import are_dataframes_equal, pytest_assert
+from pytalog.pd.data_sources.file import _read_arrow_table
+from tests.utils import are_dataframes_equal, full_match
+
+
+@fixture(scope="module")
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "x": np.array([1, 2, 3], dtype=np.int64),
+            "y": ["a", "b", "c"],
+            "z": ["3", "6", "7"],
+        }
+    )
+
+
+@fixture(scope="module")
+def numeric_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "x": np.array([1, 2, 3], dtype=np.int64),
+            "y": ["a", "b", "c"],
+            "z": np.array([3, 6, 7], dtype=np.int64),
+        }
+    )
 
 
 class TestPandasFileSource:
     def test_assert(self):
         format = "adfjklljkfd"
-        with pytest_assert(AssertionError, f"`{format}` is not a supported format for Pandas!"):
+        with raises(ValueError, match=full_match(f"`{format}` is not a supported format for Pandas!")):
             PandasFileSource("", format)
 
     def test_read_unit(self):
@@ -20,41 +48,233 @@ class TestPandasFileSource:
         args = {"a": 3, "index": False}
 
         mock_read = MagicMock()
-        try:
-            PandasFileSource.PANDAS_IO_FUNCTIONS[format] = (mock_read, None)
+        with patch.dict(PandasFileSource.PANDAS_IO_FUNCTIONS, {format: (mock_read, None)}):
             source = PandasFileSource(path, format, read_args=args)
             source.read()
 
-            mock_read.assert_called_once_with(path, **args)
-        finally:
-            del PandasFileSource.PANDAS_IO_FUNCTIONS[format]
+        mock_read.assert_called_once_with(path, **args)
+
+    @mark.parametrize(
+        ["format", "suffix", "write_kwargs", "read_kwargs"],
+        [
+            param("csv", ".csv", {"index": False}, {"dtype": {"z": "str"}}, marks=mark.slow),
+            param("excel", ".xlsx", {"index": False}, {"dtype": {"z": "str"}}, marks=mark.slow),
+            ["parquet", ".parquet", {}, {}],
+            param("json", ".json", {}, {"dtype": {"z": "str"}}, marks=mark.slow),
+        ],
+    )
+    def test_roundtrip_integration(
+        self, format: str, suffix: str, write_kwargs: dict, read_kwargs: dict, df: pd.DataFrame, tmp_path: Path
+    ):
+        path = str(tmp_path / f"data{suffix}")
+        source = PandasFileSource(path=path, format=format, read_args=read_kwargs, write_args=write_kwargs)
+        source.write(df)
+        result = source.read()
+
+        are_dataframes_equal(df, result)
 
     @mark.parametrize(
         ["format", "suffix", "write_func", "write_kwargs", "read_kwargs"],
         [
-            ["csv", ".csv", "to_csv", {"index": False}, {"dtype": {"z": "str"}}],
-            ["excel", ".xlsx", "to_excel", {"index": False}, {"dtype": {"z": "str"}}],
-            ["parquet", ".parquet", "to_parquet", {}, {}],
-            ["json", ".json", "to_json", {}, {"dtype": {"z": "str"}}],
+            param("csv", ".csv", pd.DataFrame.to_csv, {"index": False}, {"dtype": {"z": "str"}}, marks=mark.slow),
+            ["parquet", ".parquet", pd.DataFrame.to_parquet, {}, {}],
+            param("json", ".json", pd.DataFrame.to_json, {}, {"dtype": {"z": "str"}}, marks=mark.slow),
+        ],
+    )
+    def test_iter_read(
+        self,
+        format: str,
+        suffix: str,
+        write_func: Callable,
+        write_kwargs: dict,
+        read_kwargs: dict,
+        df: pd.DataFrame,
+        tmp_path: Path,
+    ):
+        path = str(tmp_path / f"data{suffix}")
+        write_func(df, path, **write_kwargs)
+
+        source = PandasFileSource(path=path, format=format, read_args=read_kwargs)
+        batches = list(source.iter_read(batch_size=2))
+
+        if format != "json":
+            assert [len(batch) for batch in batches] == [2, 1]
+        are_dataframes_equal(df, pd.concat(batches, ignore_index=True))
+
+    @mark.slow
+    @mark.parametrize(
+        "index",
+        [
+            param(pd.RangeIndex(100, 105, name="row"), id="range"),
+            param(pd.RangeIndex(10, 0, -2), id="range_negative_step"),
+            param(pd.Index([5, 3, 8, 1, 0], name="key"), id="named"),
         ],
     )
-    def test_read_integration(self, format: str, suffix: str, write_func: str, write_kwargs: dict, read_kwargs: dict):
-        df = pd.DataFrame(
-            {
-                "x": [1, 2, 3],
-                "y": ["a", "b", "c"],
-                "z": ["3", "6", "7"],
-            }
-        )
+    def test_iter_read_parquet_keeps_index(self, index: pd.Index, tmp_path: Path):
+        df = pd.DataFrame({"x": [1, 2, 3, 4, 5]}, index=index)
+        path = str(tmp_path / "data.parquet")
+        df.to_parquet(path)
+
+        source = PandasFileSource(path=path, format="parquet")
+        batches = list(source.iter_read(batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        are_dataframes_equal(df, pd.concat(batches))
+        assert list(pd.concat(batches).index) == list(index)
+        assert pd.concat(batches).index.name == index.name
+
+    def test_iter_read_csv_pyarrow_engine(self, tmp_path: Path):
+        df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+
+        path = str(tmp_path / "data.csv")
+        df.to_csv(path, index=False)
+
+        source = PandasFileSource(path=path, format="csv", read_args={"engine": "pyarrow"})
+        batches = list(source.iter_read(batch_size=2))
+
+        assert len(batches) == 1
+        are_dataframes_equal(df, batches[0], check_dtype=False)
+
+    @mark.slow
+    def test_iter_read_csv_chunksize_in_read_args(self, df: pd.DataFrame, tmp_path: Path):
+        path = str(tmp_path / "data.csv")
+        df.to_csv(path, index=False)
 
-        with NamedTemporaryFile("r+", suffix=suffix) as f:
-            writer = getattr(df, write_func)
-            writer(f.name, **write_kwargs)
+        source = PandasFileSource(path=path, format="csv", read_args={"chunksize": 1, "dtype": {"z": "str"}})
+        batches = list(source.iter_read(batch_size=2))
 
-            source = PandasFileSource(path=f.name, format=format, read_args=read_kwargs)
-            result = source.read()
+        assert [len(batch) for batch in batches] == [1, 1, 1]
+        are_dataframes_equal(df, pd.concat(batches, ignore_index=True))
+
+    def test_iter_read_remote_parquet(self, df: pd.DataFrame):
+        buffer = BytesIO()
+        df.to_parquet(buffer)
+        buffer.seek(0)
+        mock_fsspec = MagicMock()
+        mock_fsspec.open.return_value.__enter__.return_value = buffer
+
+        path = "s3://bucket/data.parquet"
+        source = PandasFileSource(path=path, format="parquet", read_args={"storage_options": {"anon": True}})
+        with patch.dict("sys.modules", {"fsspec": mock_fsspec}):
+            batches = list(source.iter_read(batch_size=2))
+
+        mock_fsspec.open.assert_called_once_with(path, "rb", anon=True)
+        assert [len(batch) for batch in batches] == [2, 1]
+        are_dataframes_equal(df, pd.concat(batches, ignore_index=True))
+
+    @mark.parametrize(
+        ["format", "suffix", "write_func", "write_kwargs"],
+        [
+            param("csv", ".csv", pd.DataFrame.to_csv, {"index": False}, marks=mark.slow),
+            param("excel", ".xlsx", pd.DataFrame.to_excel, {"index": False}, marks=mark.slow),
+            ["parquet", ".parquet", pd.DataFrame.to_parquet, {}],
+            param("json", ".json", pd.DataFrame.to_json, {}, marks=mark.slow),
+        ],
+    )
+    def test_read_columns(
+        self,
+        format: str,
+        suffix: str,
+        write_func: Callable,
+        write_kwargs: dict,
+        numeric_df: pd.DataFrame,
+        tmp_path: Path,
+    ):
+        path = str(tmp_path / f"data{suffix}")
+        write_func(numeric_df, path, **write_kwargs)
 
-            are_dataframes_equal(df, result)
+        source = PandasFileSource(path=path, format=format, columns=["x", "z"])
+        result = source.read()
+
+        are_dataframes_equal(numeric_df[["x", "z"]], result)
+
+    def test_read_columns_read_args_take_precedence(self):
+        source = PandasFileSource("", "csv", read_args={"usecols": ["a"]}, columns=["b"])
+
+        assert source._get_read_args() == {"usecols": ["a"]}
+
+    @mark.parametrize(
+        ["format", "suffix", "write_func", "write_kwargs"],
+        [
+            param("csv", ".csv", pd.DataFrame.to_csv, {"index": False}, marks=mark.slow),
+            ["parquet", ".parquet", pd.DataFrame.to_parquet, {}],
+        ],
+    )
+    def test_read_with_polars(
+        self,
+        format: str,
+        suffix: str,
+        write_func: Callable,
+        write_kwargs: dict,
+        numeric_df: pd.DataFrame,
+        tmp_path: Path,
+    ):
+        importorskip("polars")
+        path = str(tmp_path / f"data{suffix}")
+        write_func(numeric_df, path, **write_kwargs)
+
+        source = PandasFileSource(path=path, format=format, columns=["x", "y"], use_polars=True)
+        result = source.read()
+
+        are_dataframes_equal(numeric_df[["x", "y"]], result, check_dtype=False)
+
+    @mark.parametrize(
+        ["read_args", "expected"],
+        [
+            [{}, {"engine": "pyarrow", "use_threads": True, "memory_map": True}],
+            [{"use_threads": False}, {"engine": "pyarrow", "use_threads": False, "memory_map": True}],
+            [{"engine": "fastparquet"}, {"engine": "fastparquet"}],
+        ],
+    )
+    def test_parquet_read_defaults(self, read_args: dict, expected: dict):
+        source = PandasFileSource("", "parquet", read_args=read_args)
+
+        assert source._get_read_args() == expected
+
+    def test_parquet_write_defaults(self):
+        source = PandasFileSource("", "parquet", write_args={"compression": "gzip"})
+
+        assert source._get_write_args() == {"engine": "pyarrow", "compression": "gzip"}
+
+    def test_read_parquet_cached(self, tmp_path: Path):
+        df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+
+        path = str(tmp_path / "data.parquet")
+        df.to_parquet(path)
+        _read_arrow_table.cache_clear()
+        source = PandasFileSource(path=path, format="parquet", columns=["x"], cache=True)
+
+        are_dataframes_equal(df[["x"]], source.read())
+        are_dataframes_equal(df[["x"]], source.read())
+        assert _read_arrow_table.cache_info().hits == 1
+
+        stat = os.stat(path)
+        df.assign(x=[4, 5, 6]).to_parquet(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        are_dataframes_equal(pd.DataFrame({"x": [4, 5, 6]}), source.read())
+
+    def test_read_parquet_cached_is_writeable(self, tmp_path: Path):
+        df = pd.DataFrame({"x": [1, 2, 3], "y": [1.0, 2.0, 3.0]})
+
+        path = str(tmp_path / "data.parquet")
+        df.to_parquet(path)
+        _read_arrow_table.cache_clear()
+        source = PandasFileSource(path=path, format="parquet", cache=True)
+
+        result = source.read()
+        result.loc[0, "x"] = 10
+        result["y"] += 1
+
+        are_dataframes_equal(pd.DataFrame({"x": [10, 2, 3], "y": [2.0, 3.0, 4.0]}), result)
+        are_dataframes_equal(df, source.read())
+
+    def test_write_parquet_in_row_groups(self, df: pd.DataFrame, tmp_path: Path):
+        path = str(tmp_path / "data.parquet")
+        source = PandasFileSource(path=path, format="parquet", write_args={"row_group_size": 2})
+        source.write(df)
+
+        assert pq.ParquetFile(path).num_row_groups == 2
+        are_dataframes_equal(df, pd.read_parquet(path))
 
     def test_write_unit(self):
         path = "some path"
@@ -64,38 +284,9 @@ class TestPandasFileSource:
         mock_df = MagicMock()
         mock_write = MagicMock()
 
-        try:
-            PandasFileSource.PANDAS_IO_FUNCTIONS[format] = (None, mock_write)
+        with patch.dict(PandasFileSource.PANDAS_IO_FUNCTIONS, {format: (None, mock_write)}):
             source = PandasFileSource(path, format, write_args=args)
             source.write(mock_df)
 
-            mock_write.assert_called_once_with(mock_df, path, **args)
-        finally:
-            del PandasFileSource.PANDAS_IO_FUNCTIONS[format]
-
-    @mark.parametrize(
-        ["format", "suffix", "read_func", "write_kwargs", "read_kwargs"],
-        [
-            ["csv", ".csv", "read_csv", {"index": False}, {"dtype": {"z": "str"}}],
-            ["excel", ".xlsx", "read_excel", {"index": False}, {"dtype": {"z": "str"}}],
-            ["parquet", ".parquet", "read_parquet", {}, {}],
-            ["json", ".json", "read_json", {}, {"dtype": {"z": "str"}}],
-        ],
-    )
-    def test_write_integration(self, format: str, suffix: str, read_func: str, write_kwargs: dict, read_kwargs: dict):
-        df = pd.DataFrame(
-            {
-                "x": [1, 2, 3],
-                "y": ["a", "b", "c"],
-                "z": ["3", "6", "7"],
-            }
-        )
-
-        with NamedTemporaryFile("r+", suffix=suffix) as f:
-            source = PandasFileSource(path=f.name, format=format, write_args=write_kwargs)
-            source.write(df)
-
-            reader = getattr(pd, read_func)
-            result = reader(f.name, **read_kwargs)
-
-            are_dataframes_equal(df, result)
+        mock_write.assert_called_once_with(mock_df, path, **args)
+        assert format not in PandasFileSource.PANDAS_IO_FUNCTIONS
@@ -1,17 +1,24 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+from pytest import fixture
 
 from pytalog.pd.data_sources import SqlSource
 
 
+@fixture
+def mock_read_sql():
+    with patch("pytalog.pd.data_sources.sql.pd.read_sql") as mock_read_sql:
+        yield mock_read_sql
+
+
 class TestSqlSource:
-    def test_read(self):
+    def test_read(self, mock_read_sql: MagicMock):
         query = "Select * from *"
         conn = "sqlite://nowhere"
         extra = [4, 5]
         source = SqlSource(query, conn, 1, 2, extra=extra)
 
-        with patch("pytalog.pd.data_sources.sql.pd.read_sql") as mock_read_sql:
-            result = source.read()
+        result = source.read()
 
         mock_read_sql.assert_called_once_with(1, 2, sql=query, con=conn, extra=extra)
         assert result == mock_read_sql.return_value
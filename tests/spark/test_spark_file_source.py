@@ -1,68 +1,48 @@
-from unittest.mock import MagicMock
+from unittest.mock import Mock, call
+
+from pyspark.sql import SparkSession
+from pytest import fixture, mark
 
 from pytalog.spark.data_sources.spark import SparkFileSource
 
 
+@fixture(scope="class")
+def mock_spark() -> Mock:
+    return Mock(spec_set=SparkSession)
+
+
 class TestSparkFileSource:
     def test_read(self):
         path = "some path"
         format = "__tmp__"
         args = {"a": 3, "index": False}
-        mock_spark = MagicMock()
+        mock_spark = Mock(spec_set=["read"])
 
         source = SparkFileSource(path=path, format=format, spark_session=mock_spark, read_args=args)
         result = source.read()
 
-        mock_spark.read.format.assert_called_once_with(format)
-        mock_format = mock_spark.read.format.return_value
-
-        mock_format.load.assert_called_once_with(path=path, **args)
-
-        assert result == mock_format.load.return_value
-
-    def test_write(self):
-        path = "some path"
-        format = "__tmp__"
-        mode = "some mode"
-        args = {"a": 3, "index": False}
-        mock_spark = MagicMock()
-        mock_df = MagicMock()
-
-        source = SparkFileSource(path=path, format=format, spark_session=mock_spark, write_args=args, mode=mode)
-        source.write(mock_df)
-
-        mock_df.write.format.assert_called_once_with(format)
-        mock_format = mock_df.write.format.return_value
-
-        mock_format.mode.assert_called_once_with(mode)
-        mock_mode = mock_format.mode.return_value
-
-        mock_mode.option.assert_called_once_with("mergeSchema", True)
-        mock_merge_option = mock_mode.option.return_value
+        assert mock_spark.mock_calls == [call.read.format(format), call.read.format().load(path=path, **args)]
+        assert result == mock_spark.read.format.return_value.load.return_value
 
-        mock_merge_option.save.assert_called_once_with(path, **args)
-
-    def test_overwrite(self):
+    @mark.parametrize(["mode", "overwrite_schema"], [["some mode", False], ["overwrite", True]])
+    def test_write(self, mock_spark: Mock, mode: str, overwrite_schema: bool):
         path = "some path"
         format = "__tmp__"
-        mode = "overwrite"
         args = {"a": 3, "index": False}
-        mock_spark = MagicMock()
-        mock_df = MagicMock()
+        mock_df = Mock(spec_set=["write"])
 
         source = SparkFileSource(path=path, format=format, spark_session=mock_spark, write_args=args, mode=mode)
         source.write(mock_df)
 
-        mock_df.write.format.assert_called_once_with(format)
-        mock_format = mock_df.write.format.return_value
-
-        mock_format.mode.assert_called_once_with(mode)
-        mock_mode = mock_format.mode.return_value
-
-        mock_mode.option.assert_called_once_with("mergeSchema", True)
-        mock_merge_option = mock_mode.option.return_value
-
-        mock_merge_option.option.assert_called_once_with("overwriteSchema", True)
-        mock_overwrite_option = mock_merge_option.option.return_value
-
-        mock_overwrite_option.save.assert_called_once_with(path, **args)
+        writer = call.write.format().mode().option()
+        expected_calls = [
+            call.write.format(format),
+            call.write.format().mode(mode),
+            call.write.format().mode().option("mergeSchema", True),
+        ]
+        if overwrite_schema:
+            expected_calls.append(writer.option("overwriteSchema", True))
+            writer = writer.option()
+        expected_calls.append(writer.save(path, **args))
+        assert mock_df.mock_calls == expected_calls
+        assert mock_spark.mock_calls == []
@@ -1,17 +1,17 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, call, patch
 
 from pytalog.spark.data_sources.spark import SparkSqlSource
 
 
 class Test_SparkSqlSource:
     def test(self):
-        session = MagicMock()
+        session = Mock(spec_set=["sql"])
         query = "select * from table"
 
         source = SparkSqlSource(query, session)
         result = source.read()
 
-        session.sql.assert_called_once_with(query)
+        assert session.mock_calls == [call.sql(query)]
         assert result == session.sql.return_value
 
     def test_without_session(self):
@@ -8,7 +8,16 @@ from pytest import fixture, mark, param
 
 @fixture(
     scope="session",
-    params=[param("spark", marks=[mark.spark, mark.filterwarnings("ignore:distutils Version classes are deprecated")])],
+    params=[
+        param(
+            "spark",
+            marks=[
+                mark.spark,
+                mark.xdist_group("spark"),
+                mark.filterwarnings("ignore:distutils Version classes are deprecated"),
+            ],
+        )
+    ],
 )
 def spark_session() -> SparkSession:
     """Creates a SparkSession fixture for the entire test session.
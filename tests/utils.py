@@ -1,7 +1,5 @@
-from contextlib import contextmanager
-from typing import Optional
+import re
 
-import numpy as np
 import pandas as pd
 
 
@@ -10,18 +8,16 @@ class AnyArg:
         return True
 
 
-@contextmanager
-def pytest_assert(error_class, message: Optional[str] = None, exact: bool = True):
-    try:
-        yield
-        raise ValueError("No error was raised!")
-    except error_class as e:
-        if message is not None:
-            error_message: str = e.args[0]
-            if exact:
-                assert error_message == message, f"`{error_message}` != `{message}`"
-            else:
-                assert message in error_message, f"`{error_message}` not in `{message}`"
+def full_match(message: str) -> str:
+    """Create a pattern for `pytest.raises(match=...)` that only matches `message` exactly.
+
+    Args:
+        message (str): The expected error message.
+
+    Returns:
+        str: A regular expression matching only `message`.
+    """
+    return f"^{re.escape(message)}$"
 
 
 def are_dataframes_equal(
@@ -37,25 +33,25 @@ def are_dataframes_equal(
         kwargs: Any arguments to be passed to assert_frame_equal
     """
     assert expected.shape[1] == result.shape[1], f"Shapes, expected vs actual: {expected.shape[1]} != {result.shape[1]}"
-    assert np.all(
-        np.isin(expected.columns, result.columns)
-    ), f"Missing columns: {expected.columns[~np.isin(expected.columns, result.columns)]}"
+    result_columns = set(result.columns)
+    missing_columns = [col for col in expected.columns if col not in result_columns]
+    assert not missing_columns, f"Missing columns: {missing_columns}"
 
     # only sort on basic types. E.g. lists would fail.
-    sort_cols = [
-        col
-        for col in expected.columns.tolist()
-        if
-        # not a list / dict / tuple
-        (
-            pd.api.types.is_string_dtype(expected[col])
-            & (not any([isinstance(v, (list, dict, tuple)) for v in expected[col]]))
-        )
-        | pd.api.types.is_numeric_dtype(expected[col])
-        | pd.api.types.is_bool(expected[col])
-    ]
-    pd.testing.assert_frame_equal(
-        expected.sort_values(sort_cols).reset_index(drop=True),
-        result[expected.columns].sort_values(sort_cols).reset_index(drop=True),
-        **kwargs,
-    )
+    sortable = set(expected.select_dtypes(include=["number", "bool", "string"]).columns)
+    objects = expected.loc[:, (expected.dtypes == object).to_numpy()]
+    if len(objects.columns) > 0:
+        only_strings = objects.apply(lambda values: values.map(type).eq(str).all())
+        sortable.update(objects.columns[only_strings.to_numpy(dtype=bool)])
+    sort_cols = [col for col in expected.columns if col in sortable]
+
+    if sort_cols:
+        # ignore_index resets the index as part of the sort, instead of copying the result again.
+        expected = expected.sort_values(sort_cols, kind="stable", ignore_index=True)
+        result = result.sort_values(sort_cols, kind="stable", ignore_index=True)
+    else:
+        # sort_values without any columns keeps the original index.
+        expected = expected.reset_index(drop=True)
+        result = result.reset_index(drop=True)
+    # check_like ignores the order of the columns.
+    pd.testing.assert_frame_equal(expected, result, check_like=True, **kwargs)